@@ -28,45 +28,45 @@ Configuration:
 """
 
 import gradio as gr
+import asyncio
 import os
 import base64
+import functools
+import hashlib
+import random
 import signal
 import sys
 import time
 import socket
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import datetime
-from components.chat_interface import create_chat_interface, handle_scene_description
-from components.image_gallery import create_image_gallery
-from components.blender_export import create_blender_export_section, update_export_section, create_export_modal, open_export_modal, close_export_modal, export_3d_assets_to_folder
-from components.status_panel import create_status_panel
-from components.modal import create_modal, open_image_settings, close_modal, create_edit_modal, create_start_over_confirmation_modal, open_start_over_confirmation, close_start_over_confirmation
-from components.image_card import create_refresh_handler, create_3d_generation_handler, create_convert_all_3d_handler, invalidate_3d_model
-from services.agent_service import AgentService
-from services.image_generation_service import ImageGenerationService
-from services.model_3d_service import Model3DService
 import config
 import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 import gc
-import torch
 from pathlib import Path
+from urllib.parse import urlparse
 from nim_llm.manager import stop_container
 import shutil
-from utils import (
-    clear_image_generation_failure_flags, 
-    disable_all_buttons_for_3d_generation, 
-    enable_all_buttons_after_3d_generation,
-    disable_all_buttons_for_image_operations,
-    enable_all_buttons_after_image_operations,
-    is_llm_should_be_stopped
-)
 
 # Set up logging for termination server
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# App logging is handed to a background listener so request handlers never block on stdout
+_log_queue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler(sys.stdout)
+_log_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+_log_listener = QueueListener(_log_queue, _log_stream_handler)
+logger.addHandler(QueueHandler(_log_queue))
+logger.propagate = False
+_log_listener.start()
+
 # Global flag to track if we're shutting down
 _shutdown_requested = False
 
@@ -152,105 +152,200 @@ def signal_handler(signum, frame):
 signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
-# Load custom CSS and JS
+@functools.lru_cache(maxsize=None)
+def _read_asset(path, mtime_ns, binary=False):
+    """Read a static asset; the mtime in the cache key invalidates stale entries."""
+    with open(path, "rb" if binary else "r") as f:
+        return f.read()
+
+def _load_asset(path, binary=False):
+    """Load a static asset, memoized on (path, mtime)."""
+    return _read_asset(str(path), os.stat(path).st_mtime_ns, binary)
+
+def _load_logo_html(logo_path):
+    """Build the logo HTML, reusing the on-disk encoded copy while the PNG is unchanged."""
+    logo_mtime_ns = os.stat(logo_path).st_mtime_ns
+    cache_name = hashlib.md5(str(Path(logo_path).resolve()).encode()).hexdigest()
+    cache_file = config.CACHE_DIR / f"{cache_name}.b64html"
+    try:
+        if cache_file.stat().st_mtime_ns >= logo_mtime_ns:
+            return _load_asset(cache_file)
+    except OSError:
+        pass
+
+    encoded = base64.b64encode(_load_asset(logo_path, binary=True)).decode()
+    html = f"""<div class='nvidia-logo-container'>
+            <img src='data:image/png;base64,{encoded}' alt='NVIDIA Logo' class='nvidia-logo' width='24' height='24'>
+            <span class='nvidia-text'></span>
+            </div>"""
+    try:
+        cache_file.write_text(html)
+    except OSError as e:
+        logger.warning("Could not cache encoded logo: %s", e)
+    return html
+
+# Load custom CSS
 try:
-    with open(config.CUSTOM_CSS_FILE) as f:
-        custom_css = f.read()
+    custom_css = _load_asset(config.CUSTOM_CSS_FILE)
 except FileNotFoundError:
-    print("Custom CSS and JS not found")
+    print("Custom CSS not found")
     custom_css = ""
 
 # Load NVIDIA logo
 try:
-    with open(config.NVIDIA_LOGO_FILE, "rb") as image_file:
-        encoded = base64.b64encode(image_file.read()).decode()
-    
-    nvidia_html = f"""<div class='nvidia-logo-container'> 
-            <img src='data:image/png;base64,{encoded}' alt='NVIDIA Logo' class='nvidia-logo' width='24' height='24'> 
-            <span class='nvidia-text'></span> 
-            </div>"""
+    nvidia_html = _load_logo_html(config.NVIDIA_LOGO_FILE)
 except FileNotFoundError:
     # Fallback if logo not found
-    nvidia_html = """<div class='nvidia-logo-container'> 
-            <span class='nvidia-text'>Chat-to-3D</span> 
+    nvidia_html = """<div class='nvidia-logo-container'>
+            <span class='nvidia-text'>Chat-to-3D</span>
             </div>"""
 
+# Shared HTTP session for NIM health probes so polls reuse pooled connections
+_HEALTH_SESSION = requests.Session()
+_HEALTH_SESSION.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=2))
+_HEALTH_READY_TTL = 2.0  # Seconds a successful ready probe is reused
+_health_ready_cache = {}  # base_url -> monotonic timestamp of last ready response
+
+@functools.lru_cache(maxsize=None)
+def _service_address(base_url):
+    """Return the (host, port) a service base URL listens on."""
+    parsed = urlparse(base_url)
+    return parsed.hostname, parsed.port or (443 if parsed.scheme == "https" else 80)
+
+def _port_open(base_url, timeout=0.3):
+    """Cheap liveness preflight: True if something accepts TCP connections for base_url."""
+    try:
+        with socket.create_connection(_service_address(base_url), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+def _is_service_ready(base_url, timeout=1.0):
+    """Return True if the NIM at base_url reports ready.
+
+    A successful probe is reused for _HEALTH_READY_TTL seconds so bursts of
+    health checks (timer tick, manual refresh, start over) hit the network once.
+    The HTTP request is only made once the port accepts connections.
+    """
+    last_ready = _health_ready_cache.get(base_url)
+    if last_ready is not None and time.monotonic() - last_ready < _HEALTH_READY_TTL:
+        return True
+    if not _port_open(base_url):
+        _health_ready_cache.pop(base_url, None)
+        return False
+    try:
+        ready = _HEALTH_SESSION.get(f"{base_url}/health/ready", timeout=timeout).status_code == 200
+    except Exception:
+        ready = False
+    if ready:
+        _health_ready_cache[base_url] = time.monotonic()
+    else:
+        _health_ready_cache.pop(base_url, None)
+    return ready
+
+def _render_status_html(llm_ready, trellis_ready):
+    """Render the header status line for one LLM/Trellis readiness combination."""
+    llm_color = "#16be16" if llm_ready else "#f59e0b"
+    trellis_color = "#16be16" if trellis_ready else "#f59e0b"
+    llm_label = "LLM: ready" if llm_ready else "LLM: Unloaded"
+    trellis_label = "Trellis: ready" if trellis_ready else "Trellis: Unloaded"
+    return f'''
+            <div class="status-section">
+                <span class="status-text" style="color:{llm_color}">{llm_label}</span> | 
+                <span class="status-text" style="color:{trellis_color}">{trellis_label}</span>
+            </div>
+            '''
+
+# Status line for every (llm_ready, trellis_ready) combination, rendered once
+_STATUS_HTML = {
+    (llm_ready, trellis_ready): _render_status_html(llm_ready, trellis_ready)
+    for llm_ready in (False, True)
+    for trellis_ready in (False, True)
+}
+
+# Tip shown when the scene prompt is submitted empty
+_EMPTY_SCENE_TIP_HTML = """
+                <div class="tip-message">
+                    <span class="tip-icon">💡</span>
+                    <span class="tip-text">Please enter a scene description.</span>
+                </div>
+                """
+
+# Adaptive health poll interval: fast right after a state change, backing off while stable.
+# Each session keeps its own (interval, ready) pair in a gr.State.
+_INITIAL_HEALTH_POLL_STATE = (config.HEALTH_POLL_MIN_INTERVAL, False)
+
+def _next_health_poll_state(poll_state, both_ready):
+    """Return a session's next (interval, ready) pair given the latest readiness result."""
+    interval, was_ready = poll_state
+    if both_ready != was_ready:
+        return config.HEALTH_POLL_MIN_INTERVAL, both_ready
+    max_interval = config.HEALTH_POLL_READY_MAX_INTERVAL if both_ready else config.HEALTH_POLL_LOADING_MAX_INTERVAL
+    return min(max_interval, interval * 2), both_ready
+
 # Background bootstrap for LLM and Trellis NIMs
 _nim_bootstrap_started = False
 _trellis_bootstrap_started = False
-_nim_process = None  # Store reference to the LLM NIM process
-_trellis_process = None  # Store reference to the Trellis NIM process
-
-# Global state to track if we're in workspace mode
-_in_workspace_mode = False
+_child_processes = []  # Subprocesses spawned by this app; only these are stopped on shutdown
+_nim_bootstrap_lock = threading.Lock()  # Guards the bootstrap flags against concurrent triggers
 
 # Configuration flag to enable/disable status panel
 # Set to True to enable the status console panel functionality
 ENABLE_STATUS_PANEL = False
 
+def _launch_nim_script(script_path):
+    """Launch a NIM runner script as a detached child process."""
+    popen_kwargs = {}
+    if os.name == "nt":
+        popen_kwargs["creationflags"] = getattr(subprocess, "DETACHED_PROCESS", 0) | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)
+    else:
+        popen_kwargs["start_new_session"] = True
+    # Popen returns as soon as the child is spawned, so no helper thread is needed
+    process = subprocess.Popen([sys.executable, str(script_path)], stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT, **popen_kwargs)
+    _child_processes.append(process)
+    return process
+
 def _ensure_llm_nim_started():
     """Start the LLM NIM container in the background if it's not already healthy."""
     global _nim_bootstrap_started
     if _nim_bootstrap_started:
         return
-    _nim_bootstrap_started = True
-
-    health_url = f"{config.AGENT_BASE_URL}/health/ready"
-    try:
-        resp = requests.get(health_url, timeout=1.5)
-        if resp.status_code == 200:
-            print("LLM NIM already running")
+    with _nim_bootstrap_lock:
+        if _nim_bootstrap_started:
             return
-    except Exception:
-        pass
+        _nim_bootstrap_started = True
 
-    def _runner():
-        global _nim_process
-        try:
-            script_path = Path(__file__).parent / "nim_llm" / "run_llama.py"
-            print(f"Starting LLM NIM via {script_path}")
-            popen_kwargs = {}
-            if os.name == "nt":
-                popen_kwargs["creationflags"] = getattr(subprocess, "DETACHED_PROCESS", 0) | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)
-            else:
-                popen_kwargs["start_new_session"] = True
-            _nim_process = subprocess.Popen([sys.executable, str(script_path)], stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT, **popen_kwargs)
-        except Exception as e:
-            print(f"Failed to start LLM NIM: {e}")
+    if _is_service_ready(config.AGENT_BASE_URL, timeout=1.5):
+        logger.info("LLM NIM already running")
+        return
 
-    threading.Thread(target=_runner, daemon=True).start()
+    try:
+        script_path = Path(__file__).parent / "nim_llm" / "run_llama.py"
+        logger.info("Starting LLM NIM via %s", script_path)
+        _launch_nim_script(script_path)
+    except Exception as e:
+        logger.error("Failed to start LLM NIM: %s", e)
 
 def _ensure_trellis_nim_started():
     """Start the Trellis NIM container in the background if it's not already healthy."""
     global _trellis_bootstrap_started
     if _trellis_bootstrap_started:
         return
-    _trellis_bootstrap_started = True
-
-    health_url = f"{config.TRELLIS_BASE_URL}/health/ready"
-    try:
-        resp = requests.get(health_url, timeout=1.5)
-        if resp.status_code == 200:
-            print("Trellis NIM already running")
+    with _nim_bootstrap_lock:
+        if _trellis_bootstrap_started:
             return
-    except Exception:
-        pass
+        _trellis_bootstrap_started = True
 
-    def _runner():
-        global _trellis_process
-        try:
-            script_path = Path(__file__).parent / "nim_trellis" / "run_trellis.py"
-            print(f"Starting Trellis NIM via {script_path}")
-            popen_kwargs = {}
-            if os.name == "nt":
-                popen_kwargs["creationflags"] = getattr(subprocess, "DETACHED_PROCESS", 0) | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)
-            else:
-                popen_kwargs["start_new_session"] = True
-            _trellis_process = subprocess.Popen([sys.executable, str(script_path)], stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT, **popen_kwargs)
-        except Exception as e:
-            print(f"Failed to start Trellis NIM: {e}")
+    if _is_service_ready(config.TRELLIS_BASE_URL, timeout=1.5):
+        logger.info("Trellis NIM already running")
+        return
 
-    threading.Thread(target=_runner, daemon=True).start()
+    try:
+        script_path = Path(__file__).parent / "nim_trellis" / "run_trellis.py"
+        logger.info("Starting Trellis NIM via %s", script_path)
+        _launch_nim_script(script_path)
+    except Exception as e:
+        logger.error("Failed to start Trellis NIM: %s", e)
 
 def _ensure_all_nims_started():
     """Start both LLM and Trellis NIM containers in parallel."""
@@ -258,37 +353,45 @@ def _ensure_all_nims_started():
     _ensure_trellis_nim_started()
 
 
+def _release_gpu_memory():
+    """Give a stopped container a moment to exit, then release cached GPU memory."""
+    import torch
+    time.sleep(2)
+    gc.collect()
+    torch.cuda.empty_cache()
+
 def stop_llm_container(force=False):
     """Stop the LLM container after workspace transition."""
-    # Only proceed if we're in workspace mode (valid scene input)
-    global _in_workspace_mode, _nim_bootstrap_started
-    if not _in_workspace_mode and not force:
-        return
+    from utils import is_llm_should_be_stopped
+    global _nim_bootstrap_started
     if not force and not is_llm_should_be_stopped():
-        print("LLM NIM container is not stopping because VRAM threshold is met")
+        logger.info("LLM NIM container is not stopping because VRAM threshold is met")
         return
     try:
-        print("Stopping LLM NIM container...")
-        print(f"Timestamp before stop_container: {time.time()}")
+        logger.info("Stopping LLM NIM container...")
+        logger.debug("Timestamp before stop_container: %s", time.time())
         success = stop_container()
-        print(f"Timestamp after stop_container: {time.time()}")
-        time.sleep(2)
-        gc.collect()
-        torch.cuda.empty_cache()
+        logger.debug("Timestamp after stop_container: %s", time.time())
+        _release_gpu_memory()
         _nim_bootstrap_started = False
         if success:
-            print("LLM NIM container stopped and bootstrap reset")
-            print(f"Timestamp after container stop completion: {time.time()}")
+            logger.info("LLM NIM container stopped and bootstrap reset")
+            logger.debug("Timestamp after container stop completion: %s", time.time())
         else:
-            print("LLM NIM container stop command executed (may not have been running)")
-            print(f"Timestamp after container stop completion: {time.time()}")
+            logger.info("LLM NIM container stop command executed (may not have been running)")
+            logger.debug("Timestamp after container stop completion: %s", time.time())
     except Exception as e:
-        print(f"Error stopping LLM container: {e}")
-        time.sleep(2)
-        gc.collect()
-        torch.cuda.empty_cache()
+        logger.error("Error stopping LLM container: %s", e)
+        _release_gpu_memory()
         _nim_bootstrap_started = False
 
+# Single long-lived worker so container stops run off the event handler and never overlap
+_container_stop_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nim-stop")
+
+def stop_llm_container_in_background(force=False):
+    """Queue stop_llm_container on the background worker and return its future."""
+    return _container_stop_executor.submit(stop_llm_container, force)
+
 def stop_trellis_container(force=True):
     """Stop the Trellis container after workspace transition."""
     # Only proceed if we're in workspace mode (valid scene input)
@@ -296,22 +399,18 @@ def stop_trellis_container(force=True):
  
     
     try:
-        print("Stopping Trellis NIM container...")
+        logger.info("Stopping Trellis NIM container...")
         from nim_trellis.manager import stop_container as stop_trellis_container_func
         success = stop_trellis_container_func()
-        time.sleep(2)
-        gc.collect()
-        torch.cuda.empty_cache()
+        _release_gpu_memory()
         _trellis_bootstrap_started = False
         if success:
-            print("Trellis NIM container stopped and bootstrap reset")
+            logger.info("Trellis NIM container stopped and bootstrap reset")
         else:
-            print("Trellis NIM container stop command executed (may not have been running)")
+            logger.info("Trellis NIM container stop command executed (may not have been running)")
     except Exception as e:
-        print(f"Error stopping Trellis container: {e}")
-        time.sleep(2)
-        gc.collect()
-        torch.cuda.empty_cache()
+        logger.error("Error stopping Trellis container: %s", e)
+        _release_gpu_memory()
         _trellis_bootstrap_started = False
 
 def delete_assets_dir():
@@ -324,12 +423,37 @@ def delete_assets_dir():
 
 def create_app():
     """Create and configure the main Gradio application."""
+    # UI components and services pull in torch/diffusers/transformers, so they are
+    # imported here rather than at module load to keep process start-up cheap
+    from components.chat_interface import create_chat_interface, handle_scene_description
+    from components.image_gallery import create_image_gallery
+    from components.blender_export import create_blender_export_section, update_export_section, create_export_modal, open_export_modal, close_export_modal, export_3d_assets_to_folder
+    from components.status_panel import create_status_panel
+    from components.modal import create_modal, open_image_settings, close_modal, update_modal_3d_components, create_edit_modal, create_start_over_confirmation_modal, open_start_over_confirmation, close_start_over_confirmation
+    from components.image_card import create_refresh_handler, create_3d_generation_handler, create_convert_all_3d_handler, invalidate_3d_model
+    from services.agent_service import AgentService
+    from services.image_generation_service import ImageGenerationService
+    from services.model_3d_service import Model3DService
+    from utils import (
+        clear_image_generation_failure_flags, 
+        with_overrides,
+        without_field,
+        replace_item,
+        disable_all_buttons_for_3d_generation, 
+        enable_all_buttons_after_3d_generation,
+        disable_all_buttons_for_image_operations,
+        enable_all_buttons_after_image_operations,
+    )
     
     # Initialize services
     agent_service = AgentService()
     image_generation_service = ImageGenerationService()
     model_3d_service = Model3DService()
 
+    # Load the image models into host memory while the UI starts, so the first
+    # scene submit or edit skips the cold load
+    threading.Thread(target=image_generation_service.prewarm, daemon=True, name="image-prewarm").start()
+
     delete_assets_dir()
 
     # Kick off both NIM containers in background if needed (non-blocking)
@@ -434,6 +558,12 @@ def create_app():
                 # Session state to track legitimate transitions for browser refresh detection
                 session_transition_counter = gr.State(0)
                 
+                # Per-session workspace flag so one user's transition doesn't affect another's handlers
+                in_workspace_mode = gr.State(False)
+                
+                # Per-session health poll backoff, so one tab's ticks don't speed up or slow down another's
+                health_poll_state = gr.State(_INITIAL_HEALTH_POLL_STATE)
+                
             # Right: Status panel
             # Right: Status panel (conditionally enabled)
             if ENABLE_STATUS_PANEL:
@@ -444,17 +574,15 @@ def create_app():
                 right_panel = gr.Column(visible=False)
                 status_components = {"close_btn": gr.Button(visible=False)}
         
+        # Flat lists of card and export section output components, built once and shared by all events
+        all_card_outputs = gallery_components["get_all_card_outputs"]()
+        export_section_outputs = [export_components["count_display"], export_components["thumbnails_container"], export_components["export_btn"], export_components["placeholder"], export_components["export_content_active"]]
+        
         # Wire up the event handlers
         def process_scene_description(scene_description, gallery_data):
             """Process scene description and generate objects, then update gallery."""
             if not scene_description.strip():
-                tip_html = """
-                <div class="tip-message">
-                    <span class="tip-icon">💡</span>
-                    <span class="tip-text">Please enter a scene description.</span>
-                </div>
-                """
-                return "", gallery_data, tip_html, True
+                return "", gallery_data, _EMPTY_SCENE_TIP_HTML, True
             
             message, new_gallery_data, tip_html, show_tip = handle_scene_description(scene_description, agent_service, gallery_data, None)
             
@@ -493,7 +621,6 @@ def create_app():
         
         # Helper to reveal workspace and switch layout out of landing mode
         def reveal_workspace(gallery_data, current_counter):
-            global _in_workspace_mode
             # Only proceed with workspace transition if there's actual gallery data
             if not gallery_data or len(gallery_data) == 0:
                 # No gallery data means it was a non-scene input, don't transition
@@ -501,26 +628,23 @@ def create_app():
                     gr.update(visible=False),                 # keep workspace hidden
                     gr.update(elem_classes=["main-content", "landing"]), # keep landing centering
                     gr.update(visible=True),                  # keep chat section visible
-                    False,                                    # keep workspace mode False
                     current_counter,                          # keep current counter
+                    False,                                    # keep workspace mode False
                 )
             
             # Valid scene with gallery data - proceed with transition
             new_counter = current_counter + 1
-            _in_workspace_mode = True
             print(f"Transitioning to workspace mode, counter: {new_counter}")
             return (
                 gr.update(visible=True),                 # show workspace
                 gr.update(elem_classes=["main-content"]), # remove landing centering
                 gr.update(visible=False),                # hide chat section
                 new_counter,                             # increment counter
+                True,                                    # enter workspace mode
             )
 
         # Helper to reset all UI/state and return to landing
-        def go_to_first_screen():
-            global _in_workspace_mode
-            _in_workspace_mode = False
-            
+        def go_to_first_screen(poll_state):
             # Clean up SANA pipeline when going back to first screen
             print("Cleaning up SANA pipeline...")
             try:
@@ -530,21 +654,8 @@ def create_app():
                 print(f"Error cleaning up SANA pipeline: {e}")
             
             # Check if both services are ready before showing chat
-            llm_health_url = f"{config.AGENT_BASE_URL}/health/ready"
-            trellis_health_url = f"{config.TRELLIS_BASE_URL}/health/ready"
-            
-            try:
-                llm_resp = requests.get(llm_health_url, timeout=1.0)
-                llm_ready = (llm_resp.status_code == 200)
-            except Exception:
-                llm_ready = False
-                
-            try:
-                trellis_resp = requests.get(trellis_health_url, timeout=1.0)
-                trellis_ready = (trellis_resp.status_code == 200)
-            except Exception:
-                trellis_ready = False
-                
+            llm_ready = _is_service_ready(config.AGENT_BASE_URL)
+            trellis_ready = _is_service_ready(config.TRELLIS_BASE_URL)
             both_ready = llm_ready and trellis_ready
                 
             # Start the services again if not ready
@@ -558,7 +669,9 @@ def create_app():
                 gr.update(value=""),                   # clear chat input
                 gr.update(visible=False),               # hide export status
                 gr.update(visible=False) if ENABLE_STATUS_PANEL else gr.update(visible=False),  # hide right panel if open
-                gr.update(active=True),                 # restart health timer
+                gr.update(value=config.HEALTH_POLL_MIN_INTERVAL, active=True),  # restart health timer at the fastest rate
+                False,                                  # leave workspace mode
+                (config.HEALTH_POLL_MIN_INTERVAL, poll_state[1]),  # restart this session's backoff
             )
 
         # New: Mark items as image-generating to disable Start Over immediately
@@ -566,111 +679,67 @@ def create_app():
             if not gallery_data:
                 return gallery_data
             
-            # Only proceed if we're in workspace mode (valid scene input)
-            global _in_workspace_mode
-            if not _in_workspace_mode:
-                return gallery_data
-            
-            updated_data = []
-            for obj in gallery_data:
-                new_obj = obj.copy()
-                new_obj["image_generating"] = True
-                updated_data.append(new_obj)
-            return updated_data
+            # Only allocate new dicts for items whose flag actually changes
+            return [with_overrides(obj, {"image_generating": True}) for obj in gallery_data]
         
-        # New: Generate images for all objects after moving to workspace
+        # New: Generate images for all objects after moving to workspace, yielding the
+        # gallery after each image so cards fill in as soon as their image is ready
         def generate_images_for_gallery(gallery_data):
-            print(f"Timestamp before generate_images_for_gallery: {time.time()}")
-            # Only proceed if we're in workspace mode (valid scene input)
-            global _in_workspace_mode
-            if not _in_workspace_mode:
-                return gallery_data
+            logger.debug("Timestamp before generate_images_for_gallery: %s", time.time())
+            if not gallery_data:
+                return
             
-            print(f"Timestamp after generate_images_for_gallery: {time.time()}")
+            updated_data = list(gallery_data)
             try:
-                if not gallery_data:
-                    return gallery_data
-                print("Generating images for all objects (step 2)...")
-                print(f"Timestamp before generate_images_for_objects: {time.time()}")
-                success, message, generated_images = image_generation_service.generate_images_for_objects(gallery_data, output_dir=config.GENERATED_IMAGES_DIR)
-                print(f"Timestamp after generate_images_for_objects: {time.time()}")
+                logger.info("Generating images for all objects (step 2)...")
+                images = image_generation_service.iter_images_for_objects(updated_data, output_dir=config.GENERATED_IMAGES_DIR)
+                for idx, (obj, image_path) in enumerate(images):
+                    if image_path:
+                        # Clear any previous failure flags since image generation succeeded
+                        obj = clear_image_generation_failure_flags(with_overrides(obj, {"path": image_path}))
+                        logger.debug("Generated image for %s: %s", obj.get("title"), image_path)
+                    else:
+                        logger.debug("No image generated for %s", obj.get("title"))
+                    updated_data[idx] = with_overrides(obj, {"image_generating": False})
+                    yield list(updated_data)
+                logger.debug("Timestamp after generate_images_for_objects: %s", time.time())
                 if image_generation_service.if_sana_pipeline_movement_required():
                     image_generation_service.move_sana_pipeline_to_cpu()
-                    print(f"Timestamp after move_sana_pipeline_to_cpu: {time.time()}")
-                if success and generated_images:
-                    updated_data = []
-                    for obj in gallery_data:
-                        object_name = obj.get("title")
-                        new_obj = obj.copy()
-                        if object_name in generated_images:
-                            new_obj["path"] = generated_images[object_name]
-                            # Clear any previous failure flags since image generation succeeded
-                            new_obj = clear_image_generation_failure_flags(new_obj)
-                            print(f"Generated image for {object_name}: {generated_images[object_name]}")
-                        else:
-                            print(f"No image generated for {object_name}")
-                        # Clear image generation flag after completion
-                        if "image_generating" in new_obj:
-                            new_obj["image_generating"] = False
-                        updated_data.append(new_obj)
-                    return updated_data
-                else:
-                    print(f"Image generation failed: {message}")
-                    # Clear image generation flag even on failure
-                    if not gallery_data:
-                        return gallery_data
-                    updated_data = []
-                    for obj in gallery_data:
-                        new_obj = obj.copy()
-                        if "image_generating" in new_obj:
-                            new_obj["image_generating"] = False
-                        updated_data.append(new_obj)
-                    return updated_data
+                    logger.debug("Timestamp after move_sana_pipeline_to_cpu: %s", time.time())
             except Exception as e:
-                print(f"Error during image generation: {str(e)}")
-                # Clear image generation flag even on exception
-                if not gallery_data:
-                    return gallery_data
-                updated_data = []
-                for obj in gallery_data:
-                    new_obj = obj.copy()
-                    if "image_generating" in new_obj:
-                        new_obj["image_generating"] = False
-                    updated_data.append(new_obj)
-                return updated_data
+                logger.error("Error during image generation: %s", e)
+            
+            # Clear the image generation flag on anything left over after a failure
+            if any(obj.get("image_generating") for obj in updated_data):
+                yield [with_overrides(obj, {"image_generating": False}) for obj in updated_data]
         
         # Toggle start-over availability based on processing state
-        def update_start_over_state(gallery_data):
+        def update_start_over_state(gallery_data, workspace_mode):
             """Update the Start Over button state based on gallery data."""
             # Only proceed if we're in workspace mode (valid scene input)
-            global _in_workspace_mode
-            if not _in_workspace_mode:
+            if not workspace_mode:
                 return gr.update(visible=False)
             
             if not gallery_data:
                 return gr.update(visible=False)
             
-            # Check if any items are being processed
+            # Derive the busy state from the item flags rather than a per-event counter,
+            # since overlapping events each see their own copy of any session state
             any_processing = any(
-                obj.get("image_generating", False) or 
-                obj.get("3d_generating", False) or 
+                obj.get("image_generating", False) or
+                obj.get("3d_generating", False) or
                 obj.get("batch_processing", False)
                 for obj in gallery_data
             )
             
-            if any_processing:
-                return gr.update(visible=False)  # Hide button during processing
-            else:
-                return gr.update(visible=True)   # Show button when ready
+            # Hide button while anything is being processed, show it when ready
+            return gr.update(visible=not any_processing)
         
         # Health check function for both LLM and Trellis NIMs; updates status and controls UI visibility
-        def check_services_health(current_counter):
-            global _in_workspace_mode
-            print("check_services_health")
-            print("global _in_workspace_mode", _in_workspace_mode)
-            print("current_counter", current_counter)
+        def check_services_health(current_counter, workspace_mode, poll_state):
+            logger.debug("check_services_health: in_workspace_mode=%s, current_counter=%s", workspace_mode, current_counter)
 
-            if _in_workspace_mode and current_counter == 0:
+            if workspace_mode and current_counter == 0:
                 # add kill app logic here
                 print("DETECTED BROWSER REFRESH: In workspace mode but counter is 0")
                 print("This indicates browser refresh or state corruption - killing app")
@@ -694,165 +763,106 @@ def create_app():
                 
                 print("Cleanup completed")
                 print("Application shutdown complete")
+                _log_listener.stop()  # Flush queued log records before the hard exit
                 os._exit(0)
             
             
-            # Check LLM health
-            llm_health_url = f"{config.AGENT_BASE_URL}/health/ready"
-            try:
-                llm_resp = requests.get(llm_health_url, timeout=1.0)
-                llm_ready = (llm_resp.status_code == 200)
-            except Exception:
-                llm_ready = False
-            
-            # Check Trellis health
-            trellis_health_url = f"{config.TRELLIS_BASE_URL}/health/ready"
-            try:
-                trellis_resp = requests.get(trellis_health_url, timeout=1.0)
-                trellis_ready = (trellis_resp.status_code == 200)
-            except Exception:
-                trellis_ready = False
-            
-            # Build status display
-            llm_color = "#16be16" if llm_ready else "#f59e0b"
-            trellis_color = "#16be16" if trellis_ready else "#f59e0b"
-            llm_label = "LLM: ready" if llm_ready else "LLM: Unloaded"
-            trellis_label = "Trellis: ready" if trellis_ready else "Trellis: Unloaded"
+            # Check LLM and Trellis health
+            llm_ready = _is_service_ready(config.AGENT_BASE_URL)
+            trellis_ready = _is_service_ready(config.TRELLIS_BASE_URL)
             
-            status_html = f'''
-            <div class="status-section">
-                <span class="status-text" style="color:{llm_color}">{llm_label}</span> | 
-                <span class="status-text" style="color:{trellis_color}">{trellis_label}</span>
-            </div>
-            '''
+            # Pick the pre-rendered status display
+            status_html = _STATUS_HTML[(llm_ready, trellis_ready)]
             
             # Both services must be ready to proceed
             both_ready = llm_ready and trellis_ready
-            show_spinner = not both_ready and not _in_workspace_mode
+            show_spinner = not both_ready and not workspace_mode
             # Only show chat when both services are ready AND we're not in workspace mode
-            show_chat = both_ready and not _in_workspace_mode
+            show_chat = both_ready and not workspace_mode
             # Show refresh button when in workspace mode, hide when in landing mode
             show_refresh = True
-            # Stop timer if we're in workspace mode
-            timer_active = not _in_workspace_mode
-            print(f"Checking services health... LLM: {llm_ready}, Trellis: {trellis_ready}, in_workspace_mode: {_in_workspace_mode} timer_active: {timer_active}")
-            return gr.update(visible=show_spinner), gr.update(value=status_html), gr.update(visible=show_chat), gr.update(visible=show_refresh), gr.update(active=timer_active)
+            # Stop timer if we're in workspace mode, otherwise back off while the state is stable
+            timer_active = not workspace_mode
+            poll_state = _next_health_poll_state(poll_state, both_ready)
+            poll_interval = poll_state[0]
+            logger.debug("Checking services health... LLM: %s, Trellis: %s, in_workspace_mode: %s timer_active: %s next poll: %ss", llm_ready, trellis_ready, workspace_mode, timer_active, poll_interval)
+            return gr.update(visible=show_spinner), gr.update(value=status_html), gr.update(visible=show_chat), gr.update(visible=show_refresh), gr.update(value=poll_interval, active=timer_active), poll_state
         
         # Timer for initial health polling (only active until we reach workspace mode)
-        health_timer = gr.Timer(5, active=True)
+        health_timer = gr.Timer(config.HEALTH_POLL_MIN_INTERVAL, active=True)
         health_timer.tick(
             fn=check_services_health,
-            inputs=[session_transition_counter],
-            outputs=[llm_spinner, llm_status, chat_components["section"], refresh_status_btn, health_timer]
+            inputs=[session_transition_counter, in_workspace_mode, health_poll_state],
+            outputs=[llm_spinner, llm_status, chat_components["section"], refresh_status_btn, health_timer, health_poll_state]
         )
         
         # Wire up manual refresh button
         refresh_status_btn.click(
             fn=check_services_health,
-            inputs=[session_transition_counter],
-            outputs=[llm_spinner, llm_status, chat_components["section"], refresh_status_btn, health_timer]
+            inputs=[session_transition_counter, in_workspace_mode, health_poll_state],
+            outputs=[llm_spinner, llm_status, chat_components["section"], refresh_status_btn, health_timer, health_poll_state]
         )
         
-        # Connect send button to process scene description
-        chat_components["send_btn"].click(
-            fn=handle_scene_input,
-            inputs=[chat_components["input"], gallery_components["data"]],
-            outputs=[chat_components["input"], gallery_components["data"], chat_components["tip"]]
-        ).then(
-            fn=gallery_components["shift_card_ui"],
-            inputs=[gallery_components["data"]],
-            outputs=gallery_components["get_all_card_outputs"]()
-        ).then(
-            fn=update_export_section,
-            inputs=[gallery_components["data"]],
-            outputs=[export_components["count_display"], export_components["thumbnails_container"], export_components["export_btn"], export_components["placeholder"], export_components["export_content_active"]]
-        ).then(
-            fn=reveal_workspace,
-            inputs=[gallery_components["data"], session_transition_counter],
-            outputs=[workspace_section, main_col, chat_components["section"], session_transition_counter]
-        ).then(
-            fn=mark_images_generating,
-            inputs=[gallery_components["data"]],
-            outputs=[gallery_components["data"]]
-        ).then(
-            fn=gallery_components["shift_card_ui"],
-            inputs=[gallery_components["data"]],
-            outputs=gallery_components["get_all_card_outputs"]()
-        ).then(
-            fn=update_start_over_state,
-            inputs=[gallery_components["data"]],
-            outputs=[start_over_btn]
-        ).then(
-            fn=stop_llm_container,
-            inputs=[],
-            outputs=[]
-        ).then(
-            fn=generate_images_for_gallery,
-            inputs=[gallery_components["data"]],
-            outputs=[gallery_components["data"]]
-        ).then(
-            fn=gallery_components["shift_card_ui"],
-            inputs=[gallery_components["data"]],
-            outputs=gallery_components["get_all_card_outputs"]()
-        ).then(
-            fn=update_export_section,
-            inputs=[gallery_components["data"]],
-            outputs=[export_components["count_display"], export_components["thumbnails_container"], export_components["export_btn"], export_components["placeholder"], export_components["export_content_active"]]
-        ).then(
-            fn=update_start_over_state,
-            inputs=[gallery_components["data"]],
-            outputs=[start_over_btn]
+        # Export section and Start Over are refreshed together at the end of each chain
+        def refresh_export_and_start_over(gallery_data, workspace_mode):
+            return (*update_export_section(gallery_data), update_start_over_state(gallery_data, workspace_mode))
+        
+        # Scene submission runs as one streamed event: plan the scene and reveal the
+        # workspace, then generate images, yielding the UI state after each phase
+        def on_scene_submit(scene_description, gallery_data, current_counter):
+            """Handle scene input end to end, yielding UI updates as each phase completes."""
+            message, gallery_data, tip_update = handle_scene_input(scene_description, gallery_data)
+            workspace_update, main_col_update, chat_section_update, current_counter, workspace_mode = reveal_workspace(gallery_data, current_counter)
+            if workspace_mode:
+                gallery_data = mark_images_generating(gallery_data)
+            yield (
+                message, gallery_data, tip_update,
+                *gallery_components["shift_card_ui"](gallery_data),
+                *update_export_section(gallery_data),
+                workspace_update, main_col_update, chat_section_update, current_counter, workspace_mode,
+                update_start_over_state(gallery_data, workspace_mode),
+            )
+            
+            # Non-scene input: the tip is shown and we stay on the first screen
+            if not workspace_mode:
+                return
+            
+            # Load SANA weights into host memory while the LLM container shuts down, then
+            # wait for the stop so its VRAM is free before the pipeline moves to the GPU
+            llm_stop = stop_llm_container_in_background()
+            image_generation_service.load_sana_model(device="cpu")
+            llm_stop.result()
+            for gallery_data in generate_images_for_gallery(gallery_data):
+                yield (
+                    gr.update(), gallery_data, gr.update(),
+                    *gallery_components["shift_card_ui"](gallery_data),
+                    *update_export_section(gallery_data),
+                    gr.update(), gr.update(), gr.update(), current_counter, workspace_mode,
+                    gr.update(),
+                )
+            
+            yield (
+                gr.update(), gr.update(), gr.update(),
+                *[gr.update()] * len(all_card_outputs),
+                *[gr.update()] * 5,
+                gr.update(), gr.update(), gr.update(), current_counter, workspace_mode,
+                update_start_over_state(gallery_data, workspace_mode),
+            )
+        
+        scene_submit_inputs = [chat_components["input"], gallery_components["data"], session_transition_counter]
+        scene_submit_outputs = (
+            [chat_components["input"], gallery_components["data"], chat_components["tip"]]
+            + all_card_outputs
+            + export_section_outputs
+            + [workspace_section, main_col, chat_components["section"], session_transition_counter, in_workspace_mode, start_over_btn]
         )
         
-        # Connect Enter key for scene input
-        chat_components["input"].submit(
-            fn=handle_scene_input,
-            inputs=[chat_components["input"], gallery_components["data"]],
-            outputs=[chat_components["input"], gallery_components["data"], chat_components["tip"]]
-        ).then(
-            fn=gallery_components["shift_card_ui"],
-            inputs=[gallery_components["data"]],
-            outputs=gallery_components["get_all_card_outputs"]()
-        ).then(
-            fn=update_export_section,
-            inputs=[gallery_components["data"]],
-            outputs=[export_components["count_display"], export_components["thumbnails_container"], export_components["export_btn"], export_components["placeholder"], export_components["export_content_active"]]
-        ).then(
-            fn=reveal_workspace,
-            inputs=[gallery_components["data"], session_transition_counter],
-            outputs=[workspace_section, main_col, chat_components["section"], session_transition_counter]
-        ).then(
-            fn=mark_images_generating,
-            inputs=[gallery_components["data"]],
-            outputs=[gallery_components["data"]]
-        ).then(
-            fn=gallery_components["shift_card_ui"],
-            inputs=[gallery_components["data"]],
-            outputs=gallery_components["get_all_card_outputs"]()
-        ).then(
-            fn=update_start_over_state,
-            inputs=[gallery_components["data"]],
-            outputs=[start_over_btn]
-        ).then(
-            fn=stop_llm_container,
-            inputs=[],
-            outputs=[]
-        ).then(
-            fn=generate_images_for_gallery,
-            inputs=[gallery_components["data"]],
-            outputs=[gallery_components["data"]]
-        ).then(
-            fn=gallery_components["shift_card_ui"],
-            inputs=[gallery_components["data"]],
-            outputs=gallery_components["get_all_card_outputs"]()
-        ).then(
-            fn=update_export_section,
-            inputs=[gallery_components["data"]],
-            outputs=[export_components["count_display"], export_components["thumbnails_container"], export_components["export_btn"], export_components["placeholder"], export_components["export_content_active"]]
-        ).then(
-            fn=update_start_over_state,
-            inputs=[gallery_components["data"]],
-            outputs=[start_over_btn]
+        # Send button and Enter key share a single event registration
+        gr.on(
+            triggers=[chat_components["send_btn"].click, chat_components["input"].submit],
+            fn=on_scene_submit,
+            inputs=scene_submit_inputs,
+            outputs=scene_submit_outputs
         )
 
         # Start over button: show confirmation dialog first
@@ -892,8 +902,8 @@ def create_app():
             outputs=[gallery_components["data"]]
         ).then(
             fn=go_to_first_screen,
-            inputs=[],
-            outputs=[workspace_section, main_col, chat_components["section"], chat_components["input"], export_status, right_panel, health_timer]
+            inputs=[health_poll_state],
+            outputs=[workspace_section, main_col, chat_components["section"], chat_components["input"], export_status, right_panel, health_timer, in_workspace_mode, health_poll_state]
         )
         
         # Connect toggle button to show/hide right panel (only if status panel is enabled)
@@ -912,36 +922,52 @@ def create_app():
             # Hide toggle button when status panel is disabled
             toggle_btn.visible = False
         
+        # Card buttons share one event per action; the handlers look up the card index
+        # from the component that fired the event
+        card_index_by_trigger = {
+            card[key]: idx
+            for idx, card in enumerate(gallery_components["card_components"])
+            for key in ("card_click_btn", "refresh_btn", "edit_btn", "delete_btn", "to_3d_btn")
+        }
+        
+        def card_triggers(key):
+            return [card[key].click for card in gallery_components["card_components"]]
+        
         # Modal functionality
         def debug_card_click(path, title, gallery_data, card_idx):
-            print(f"DEBUG: Card clicked! Path: {path}, Title: {title}, Card Index: {card_idx}")
+            logger.debug("Card clicked! Path: %s, Title: %s, Card Index: %s", path, title, card_idx)
             return open_image_settings(path, title, gallery_data, card_idx)
         
+        def card_click(gallery_data, evt: gr.EventData):
+            """Open the settings modal for the clicked card."""
+            card_idx = card_index_by_trigger[evt.target]
+            if card_idx < len(gallery_data):
+                item = gallery_data[card_idx]
+                return debug_card_click(item["path"], item["title"], gallery_data, card_idx)
+            logger.debug("Card %s not found in gallery_data", card_idx)
+            return debug_card_click("", "", gallery_data, card_idx)
+        
+        def show_settings_modal():
+            return gr.update(visible=True)
+        
+        def toggle_modal_3d(glb_path):
+            return gr.update(visible=(glb_path is not None)), gr.update(visible=(glb_path is None))
+        
         # Wire up card click events for modal
-        for idx, card in enumerate(gallery_components["card_components"]):
-            def create_dynamic_click_handler(card_idx):
-                def click_handler(gallery_data):
-                    if card_idx < len(gallery_data):
-                        item = gallery_data[card_idx]
-                        print(f"DEBUG: Dynamic click for card {card_idx}: {item['title']}")
-                        return debug_card_click(item["path"], item["title"], gallery_data, card_idx)
-                    else:
-                        print(f"DEBUG: Card {card_idx} not found in gallery_data")
-                        return debug_card_click("", "", gallery_data, card_idx)
-                return click_handler
-            
-            card["card_click_btn"].click(
-                fn=create_dynamic_click_handler(idx),
-                inputs=[gallery_components["data"]],
-                outputs=[modal_image_title, modal_image, modal_visible, overlay, modal_3d]
-            ).then(
-                fn=lambda: gr.update(visible=True),
-                outputs=[settings_modal]
-            ).then(
-                fn=lambda glb_path: (gr.update(visible=(glb_path is not None)), gr.update(visible=(glb_path is None))),
-                inputs=[modal_3d],
-                outputs=[modal_3d, no_3d_message]
-            )
+        gr.on(
+            triggers=card_triggers("card_click_btn"),
+            fn=card_click,
+            inputs=[gallery_components["data"]],
+            outputs=[modal_image_title, modal_image, modal_visible, overlay, modal_3d],
+            concurrency_limit=None
+        ).then(
+            fn=show_settings_modal,
+            outputs=[settings_modal]
+        ).then(
+            fn=toggle_modal_3d,
+            inputs=[modal_3d],
+            outputs=[modal_3d, no_3d_message]
+        )
         
         # Close modal button
         close_btn.click(
@@ -957,8 +983,9 @@ def create_app():
         )
         
         # Edit modal functionality
-        def open_edit_modal(idx, gallery_data):
-            """Open edit modal for the specified card index."""
+        def open_edit_modal(gallery_data, evt: gr.EventData):
+            """Open edit modal for the clicked card."""
+            idx = card_index_by_trigger[evt.target]
             if idx < len(gallery_data):
                 item = gallery_data[idx]
                 return (
@@ -979,160 +1006,125 @@ def create_app():
         # Create convert all to 3D handler (two-stage process)
         disable_buttons_handler, convert_all_handler = create_convert_all_3d_handler(model_3d_service)
         
-        def update_modal_3d_components(gallery_data, card_idx):
-            """Update modal 3D components based on 3D model availability."""
+        def immediate_disable_buttons(card_idx, gallery_data):
+            """First stage: immediately disable all buttons."""
             if card_idx < len(gallery_data):
-                obj = gallery_data[card_idx]
-                if obj.get("glb_path") and os.path.exists(obj["glb_path"]):
-                    return gr.update(value=obj["glb_path"], visible=True), gr.update(visible=False)
-                else:
-                    return gr.update(value=None, visible=False), gr.update(visible=True)
-            else:
-                return gr.update(value=None, visible=False), gr.update(visible=True)
-        
-        # Wire up refresh button events for each card
-        for idx, card in enumerate(gallery_components["card_components"]):
-            def create_refresh_function(card_idx):
-                def immediate_disable_buttons(gallery_data):
-                    """First stage: immediately disable all buttons."""
-                    if card_idx < len(gallery_data):
-                        # Create a copy and mark as generating
-                        updated_data = gallery_data.copy()
-                        updated_data[card_idx]["image_generating"] = True
-                        print(f"DEBUG: Set image_generating=True for card {card_idx}")
-                        
-                        # Disable all buttons globally
-                        updated_data = disable_all_buttons_for_image_operations(updated_data)
-                        
-                        # Return the updated data immediately to show generating state
-                        return updated_data
-                    else:
-                        print(f"DEBUG: Card index {card_idx} out of range")
-                        return gallery_data
+                # Copy only the affected card and mark it as generating
+                updated_data = replace_item(gallery_data, card_idx, {"image_generating": True})
+                logger.debug("Set image_generating=True for card %s", card_idx)
                 
-                def perform_image_refresh(gallery_data):
-                    """Second stage: perform the actual image refresh."""
-                    print(f"DEBUG: Performing actual image refresh for card {card_idx}")
-                    result = refresh_handler(card_idx, gallery_data)
-                    
-                    # Re-enable all buttons after image refresh completes (success or failure)
-                    result = enable_all_buttons_after_image_operations(result)
-                    
-                    return result
+                # Disable all buttons globally
+                updated_data = disable_all_buttons_for_image_operations(updated_data)
                 
-                return immediate_disable_buttons, perform_image_refresh
+                # Return the updated data immediately to show generating state
+                return updated_data
+            else:
+                logger.warning("Card index %s out of range", card_idx)
+                return gallery_data
+        
+        def perform_image_refresh(card_idx, gallery_data):
+            """Second stage: perform the actual image refresh."""
+            logger.debug("Performing actual image refresh for card %s", card_idx)
+            result = refresh_handler(card_idx, gallery_data)
             
-            # Create the functions for this specific card
-            immediate_disable_fn, refresh_fn = create_refresh_function(idx)
+            # Re-enable all buttons after image refresh completes (success or failure)
+            result = enable_all_buttons_after_image_operations(result)
             
-            # First click: immediate UI update to disable buttons
-            card["refresh_btn"].click(
-                fn=immediate_disable_fn,
-                inputs=[gallery_components["data"]],
-                outputs=[gallery_components["data"]]
-            ).then(
-                fn=gallery_components["shift_card_ui"],
-                inputs=[gallery_components["data"]],
-                outputs=gallery_components["get_all_card_outputs"]()
-            ).then(
-                fn=update_start_over_state,              # immediately disable Start Over
-                inputs=[gallery_components["data"]],
-                outputs=[start_over_btn]
-            ).then(
-                fn=refresh_fn,
-                inputs=[gallery_components["data"]],
-                outputs=[gallery_components["data"]]
-            ).then(
-                fn=gallery_components["shift_card_ui"],
-                inputs=[gallery_components["data"]],
-                outputs=gallery_components["get_all_card_outputs"]()
-            ).then(
-                fn=update_export_section,
-                inputs=[gallery_components["data"]],
-                outputs=[export_components["count_display"], export_components["thumbnails_container"], export_components["export_btn"], export_components["placeholder"], export_components["export_content_active"]]
-            ).then(
-                fn=update_start_over_state,
-                inputs=[gallery_components["data"]],
-                outputs=[start_over_btn]
+            return result
+        
+        def refresh_image_flow(gallery_data, workspace_mode, evt: gr.EventData):
+            """Regenerate one card's image, yielding the UI state before and after."""
+            card_idx = card_index_by_trigger[evt.target]
+            gallery_data = immediate_disable_buttons(card_idx, gallery_data)
+            yield (
+                gallery_data,
+                *gallery_components["shift_card_ui"](gallery_data),
+                *[gr.update()] * len(export_section_outputs),
+                update_start_over_state(gallery_data, workspace_mode),  # immediately disable Start Over
+            )
+            
+            gallery_data = perform_image_refresh(card_idx, gallery_data)
+            yield (
+                gallery_data,
+                *gallery_components["shift_card_ui"](gallery_data),
+                *refresh_export_and_start_over(gallery_data, workspace_mode),
             )
         
-        # Wire up 3D generation button events for each card
-        for idx, card in enumerate(gallery_components["card_components"]):
-            def create_3d_function(card_idx):
-                def generate_3d_for_card(gallery_data):
-                    # Immediately update the button to show "generating" state
-                    if card_idx < len(gallery_data):
-                        # Create a copy and mark as generating
-                        updated_data = gallery_data.copy()
-                        updated_data[card_idx]["3d_generating"] = True
-                        print(f"DEBUG: Set 3d_generating=True for card {card_idx}")
-                        
-                        # Disable all buttons globally if VRAM threshold is met
-                        updated_data = disable_all_buttons_for_3d_generation(updated_data)
-                        
-                        # Return the updated data immediately to show "⏳ 3D..." state
-                        return updated_data
-                    else:
-                        print(f"DEBUG: Card index {card_idx} out of range")
-                        return gallery_data
+        # Wire up refresh button events; one event serves every card. No concurrency limit,
+        # so refreshes on different cards still run side by side as with per-card events.
+        gr.on(
+            triggers=card_triggers("refresh_btn"),
+            fn=refresh_image_flow,
+            inputs=[gallery_components["data"], in_workspace_mode],
+            outputs=[gallery_components["data"]] + all_card_outputs + export_section_outputs + [start_over_btn],
+            concurrency_limit=None
+        )
+        
+        # 3D generation runs as one streamed event per click: mark the card as
+        # generating, run the conversion, then publish the final gallery state
+        def generate_3d_for_card(card_idx, gallery_data):
+            # Immediately update the button to show "generating" state
+            if card_idx < len(gallery_data):
+                # Copy only the affected card and mark it as generating
+                updated_data = replace_item(gallery_data, card_idx, {"3d_generating": True})
+                logger.debug("Set 3d_generating=True for card %s", card_idx)
                 
-                def perform_3d_generation(gallery_data):
-                    print(f"DEBUG: Performing actual 3D generation for card {card_idx}")
-                    result = three_d_handler(card_idx, gallery_data)
-                    
-                    # Re-enable all buttons after 3D generation completes (success or failure)
-                    result = enable_all_buttons_after_3d_generation(result)
-                    
-                    return result
+                # Disable all buttons globally if VRAM threshold is met
+                updated_data = disable_all_buttons_for_3d_generation(updated_data)
                 
-                return generate_3d_for_card, perform_3d_generation
+                # Return the updated data immediately to show "⏳ 3D..." state
+                return updated_data
+            else:
+                logger.warning("Card index %s out of range", card_idx)
+                return gallery_data
+        
+        def perform_3d_generation(card_idx, gallery_data):
+            logger.debug("Performing actual 3D generation for card %s", card_idx)
+            result = three_d_handler(card_idx, gallery_data)
             
-            # Create the functions for this specific card
-            immediate_update_fn, generation_fn = create_3d_function(idx)
+            # Re-enable all buttons after 3D generation completes (success or failure)
+            result = enable_all_buttons_after_3d_generation(result)
             
-            # First click: immediate UI update
-            card["to_3d_btn"].click(
-                fn=immediate_update_fn,
-                inputs=[gallery_components["data"]],
-                outputs=[gallery_components["data"]]
-            ).then(
-                fn=gallery_components["shift_card_ui"],
-                inputs=[gallery_components["data"]],
-                outputs=gallery_components["get_all_card_outputs"]()
-            ).then(
-                fn=update_start_over_state,              # immediately disable Start Over
-                inputs=[gallery_components["data"]],
-                outputs=[start_over_btn]
-            ).then(
-                fn=generation_fn,
-                inputs=[gallery_components["data"]],
-                outputs=[gallery_components["data"]]
-            ).then(
-                fn=gallery_components["shift_card_ui"],
-                inputs=[gallery_components["data"]],
-                outputs=gallery_components["get_all_card_outputs"]()
-            ).then(
-                fn=update_export_section,
-                inputs=[gallery_components["data"]],
-                outputs=[export_components["count_display"], export_components["thumbnails_container"], export_components["export_btn"], export_components["placeholder"], export_components["export_content_active"]]
-            ).then(
-                fn=update_start_over_state,
-                inputs=[gallery_components["data"]],
-                outputs=[start_over_btn]
-            ).then(
-                fn=lambda data, idx=idx: update_modal_3d_components(data, idx),
-                inputs=[gallery_components["data"]],
-                outputs=[modal_3d, no_3d_message]
-            )
+            return result
         
-        # Wire up edit button events for each card
-        for idx, card in enumerate(gallery_components["card_components"]):
-            card["edit_btn"].click(
-                fn=open_edit_modal,
-                inputs=[gr.State(idx), gallery_components["data"]],
-                outputs=[edit_modal, edit_current_index, edit_title, edit_description]
+        def generate_3d_flow(gallery_data, workspace_mode, evt: gr.EventData):
+            """Generate a 3D model for one card, yielding the UI state before and after."""
+            card_idx = card_index_by_trigger[evt.target]
+            gallery_data = generate_3d_for_card(card_idx, gallery_data)
+            yield (
+                gallery_data,
+                *gallery_components["shift_card_ui"](gallery_data),
+                *[gr.update()] * len(export_section_outputs),
+                update_start_over_state(gallery_data, workspace_mode),  # immediately disable Start Over
+                gr.update(), gr.update(),
+            )
+            
+            gallery_data = perform_3d_generation(card_idx, gallery_data)
+            yield (
+                gallery_data,
+                *gallery_components["shift_card_ui"](gallery_data),
+                *refresh_export_and_start_over(gallery_data, workspace_mode),
+                *update_modal_3d_components(gallery_data, card_idx),
             )
         
+        # Wire up 3D generation button events for all cards
+        gr.on(
+            triggers=card_triggers("to_3d_btn"),
+            fn=generate_3d_flow,
+            inputs=[gallery_components["data"], in_workspace_mode],
+            outputs=[gallery_components["data"]] + all_card_outputs + export_section_outputs + [start_over_btn, modal_3d, no_3d_message],
+            concurrency_limit=None
+        )
+        
+        # Wire up edit button events for all cards
+        gr.on(
+            triggers=card_triggers("edit_btn"),
+            fn=open_edit_modal,
+            inputs=[gallery_components["data"]],
+            outputs=[edit_modal, edit_current_index, edit_title, edit_description],
+            concurrency_limit=None
+        )
+        
         # Cancel edit button
         cancel_edit_btn.click(
             fn=lambda: (gr.update(visible=False), None, "", ""),
@@ -1145,18 +1137,16 @@ def create_app():
             if edit_idx is not None and edit_idx < len(gallery_data):
                 # Validate the inputs
                 if not new_title or not new_title.strip():
-                    print(f"Empty title provided for card {edit_idx}")
+                    logger.warning("Empty title provided for card %s", edit_idx)
                     return gallery_data
                 
                 if not new_description or not new_description.strip():
-                    print(f"Empty description provided for card {edit_idx}")
+                    logger.warning("Empty description provided for card %s", edit_idx)
                     return gallery_data
                 
-                updated_data = gallery_data.copy()
-                
-                # Mark the specific card as generating
-                updated_data[edit_idx]["image_generating"] = True
-                print(f"DEBUG: Set image_generating=True for edit card {edit_idx}")
+                # Mark the specific card as generating, copying only that card
+                updated_data = replace_item(gallery_data, edit_idx, {"image_generating": True})
+                logger.debug("Set image_generating=True for edit card %s", edit_idx)
                 
                 # Disable all buttons globally
                 updated_data = disable_all_buttons_for_image_operations(updated_data)
@@ -1169,20 +1159,23 @@ def create_app():
             """Second stage: perform the actual edit update and image generation."""
             try:
                 if edit_idx is not None and edit_idx < len(gallery_data):
-                    updated_data = gallery_data.copy()
-                    obj = updated_data[edit_idx]
-                    old_object_name = obj["title"]
+                    old_object_name = gallery_data[edit_idx]["title"]
+                    
+                    # Update the title and description on a private copy of the edited card
+                    updated_data = replace_item(gallery_data, edit_idx, {"title": new_title.strip(), "description": new_description.strip()})
                     
-                    # Update the title and description
-                    updated_data[edit_idx]["title"] = new_title.strip()
-                    updated_data[edit_idx]["description"] = new_description.strip()
+                    # An unchanged prompt would only redraw the same object, so keep the
+                    # current image and 3D model and just apply any title change
+                    if new_description.strip() == gallery_data[edit_idx].get("description", "").strip():
+                        logger.info("Description unchanged for '%s' - skipping image regeneration", new_title.strip())
+                        updated_data[edit_idx] = without_field(updated_data[edit_idx], "image_generating")
+                        return enable_all_buttons_after_image_operations(updated_data)
                     
                     # Generate a new random seed for the updated prompt
-                    import random
                     new_seed = random.randint(1, 999999)
                     
-                    print(f"Updating image for '{new_title}' with new prompt and seed {new_seed}")
-                    print(f"   New prompt: {new_description}")
+                    logger.debug("Updating image for '%s' with new prompt and seed %s", new_title, new_seed)
+                    logger.debug("New prompt: %s", new_description)
                     
                     # Generate new image using SANA service with the updated prompt
                     success, message, new_image_path = image_generation_service.generate_image_from_prompt(
@@ -1192,44 +1185,43 @@ def create_app():
                         seed=new_seed
                     )
                     if image_generation_service.if_sana_pipeline_movement_required():
-                        print(f"Timestamp after generate_image_from_prompt: {time.time()}")
+                        logger.debug("Timestamp after generate_image_from_prompt: %s", time.time())
                         image_generation_service.move_sana_pipeline_to_cpu()
-                        print(f"Timestamp after move_sana_pipeline_to_cpu: {time.time()}")
+                        logger.debug("Timestamp after move_sana_pipeline_to_cpu: %s", time.time())
 
                     invalidate_reason = None
                     
                     if success and new_image_path:
-                        # Update the image path and seed
-                        updated_data[edit_idx]["path"] = new_image_path
-                        updated_data[edit_idx]["seed"] = new_seed
-                        
-                        # Clear any previous failure flags since image generation succeeded
-                        updated_data[edit_idx] = clear_image_generation_failure_flags(updated_data[edit_idx])
+                        # Update the image path and seed, and clear any previous failure flags
+                        # since image generation succeeded
+                        updated_data[edit_idx] = clear_image_generation_failure_flags(
+                            with_overrides(updated_data[edit_idx], {"path": new_image_path, "seed": new_seed})
+                        )
                         
                         invalidate_reason = "image update"
-                        print(f"Successfully generated new image: {new_image_path}")
+                        logger.info("Successfully generated new image: %s", new_image_path)
                     elif message == "PROMPT_CONTENT_FILTERED":
                         # Handle 2D prompt content filtered case
-                        updated_data[edit_idx]["path"] = "static/images/content_filtered.svg"
-                        updated_data[edit_idx]["prompt_content_filtered"] = True
-                        updated_data[edit_idx]["prompt_content_filtered_timestamp"] = datetime.datetime.now().isoformat()
+                        updated_data[edit_idx] = with_overrides(updated_data[edit_idx], {
+                            "path": "static/images/content_filtered.svg",
+                            "prompt_content_filtered": True,
+                            "prompt_content_filtered_timestamp": datetime.datetime.now().isoformat(),
+                        })
                         
                         invalidate_reason = "2D prompt content filtered"
-                        print(f"2D prompt content filtered for '{new_title}' - using dummy image")
+                        logger.warning("2D prompt content filtered for '%s' - using dummy image", new_title)
                     else:
-                        updated_data[edit_idx]["image_generation_failed"] = True
-                        updated_data[edit_idx]["image_generation_error"] = message
+                        updated_data[edit_idx] = with_overrides(updated_data[edit_idx], {"image_generation_failed": True, "image_generation_error": message})
 
-                        invalidate_reason = "image generation failed"
-                        print(f"Failed to generate new image: {message}")
+                        logger.warning("Failed to generate new image: %s", message)
                     
                     # Clear the image_generating flag since the operation is complete
-                    if "image_generating" in updated_data[edit_idx]:
-                        del updated_data[edit_idx]["image_generating"]
+                    updated_data[edit_idx] = without_field(updated_data[edit_idx], "image_generating")
                     
-                    updated_data = invalidate_3d_model(updated_data, edit_idx, new_title.strip(), invalidate_reason)
-                    if "batch_processing" in updated_data[edit_idx]:
-                        del updated_data[edit_idx]["batch_processing"]
+                    # The card keeps its old image when generation fails, so its 3D model stays valid
+                    if invalidate_reason:
+                        updated_data = invalidate_3d_model(updated_data, edit_idx, new_title.strip(), invalidate_reason)
+                    updated_data[edit_idx] = without_field(updated_data[edit_idx], "batch_processing")
                     
                     # Re-enable all buttons after edit update completes (success or failure)
                     updated_data = enable_all_buttons_after_image_operations(updated_data)
@@ -1237,110 +1229,115 @@ def create_app():
                     return updated_data
                 return gallery_data
             except Exception as e:
-                print(f"Error in edit update: {str(e)}")
+                logger.error("Error in edit update: %s", e)
                 # Ensure we clear the image_generating flag and re-enable buttons even on exception
-                updated_data = gallery_data.copy()
+                updated_data = list(gallery_data)
                 if edit_idx is not None and edit_idx < len(updated_data):
-                    if "image_generating" in updated_data[edit_idx]:
-                        del updated_data[edit_idx]["image_generating"]
+                    updated_data[edit_idx] = without_field(updated_data[edit_idx], "image_generating")
                 updated_data = enable_all_buttons_after_image_operations(updated_data)
                 return updated_data
         
+        async def edit_update_flow(edit_idx, new_title, new_description, gallery_data, workspace_mode):
+            """Apply an edit as one streamed event.
+            
+            The modal closes and the card shows its generating state right away; image
+            generation then runs in a worker thread so the event loop stays free.
+            """
+            edit_modal_closed = (gr.update(visible=False), None, "", "")
+            marked_data = immediate_disable_buttons_for_edit(edit_idx, new_title, new_description, gallery_data)
+            yield (
+                marked_data,
+                *gallery_components["shift_card_ui"](marked_data),
+                *[gr.update()] * len(export_section_outputs),
+                update_start_over_state(marked_data, workspace_mode),  # immediately disable Start Over
+                *edit_modal_closed,
+            )
+            
+            gallery_data = await asyncio.to_thread(perform_edit_update, edit_idx, new_title, new_description, marked_data)
+            yield (
+                gallery_data,
+                *gallery_components["shift_card_ui"](gallery_data),
+                *refresh_export_and_start_over(gallery_data, workspace_mode),
+                *[gr.update()] * len(edit_modal_closed),
+            )
+        
         update_edit_btn.click(
-            fn=immediate_disable_buttons_for_edit,
-            inputs=[edit_current_index, edit_title, edit_description, gallery_components["data"]],
-            outputs=[gallery_components["data"]]
-        ).then(
-            fn=gallery_components["shift_card_ui"],
-            inputs=[gallery_components["data"]],
-            outputs=gallery_components["get_all_card_outputs"]()
-        ).then(
-            fn=update_start_over_state,              # immediately disable Start Over
+            fn=edit_update_flow,
+            inputs=[edit_current_index, edit_title, edit_description, gallery_components["data"], in_workspace_mode],
+            outputs=[gallery_components["data"]] + all_card_outputs + export_section_outputs + [start_over_btn, edit_modal, edit_current_index, edit_title, edit_description]
+        )
+        
+        def delete_specific_card(gallery_data, evt: gr.EventData):
+            card_idx = card_index_by_trigger[evt.target]
+            if card_idx < len(gallery_data):
+                logger.debug("Deleting card at index: %s title: %s", card_idx, gallery_data[card_idx]['title'])
+                # Check if this card has a 3D asset that will be removed
+                has_3d_asset = gallery_data[card_idx].get("glb_path") and gallery_data[card_idx]["glb_path"]
+                if has_3d_asset:
+                    logger.debug("Removing 3D asset: %s", gallery_data[card_idx]['glb_path'])
+                
+                # Remove the card from gallery data
+                updated_data = list(gallery_data)
+                del updated_data[card_idx]
+                return updated_data
+            else:
+                logger.warning("Card index %s out of range", card_idx)
+                return gallery_data
+        
+        # Wire up delete button events for all cards
+        gr.on(
+            triggers=card_triggers("delete_btn"),
+            fn=delete_specific_card,
             inputs=[gallery_components["data"]],
-            outputs=[start_over_btn]
-        ).then(
-            fn=perform_edit_update,
-            inputs=[edit_current_index, edit_title, edit_description, gallery_components["data"]],
-            outputs=[gallery_components["data"]]
+            outputs=[gallery_components["data"]],
+            concurrency_limit=None
         ).then(
             fn=gallery_components["shift_card_ui"],
             inputs=[gallery_components["data"]],
-            outputs=gallery_components["get_all_card_outputs"]()
+            outputs=all_card_outputs
         ).then(
             fn=update_export_section,
             inputs=[gallery_components["data"]],
-            outputs=[export_components["count_display"], export_components["thumbnails_container"], export_components["export_btn"], export_components["placeholder"], export_components["export_content_active"]]
-        ).then(
-            fn=update_start_over_state,
-            inputs=[gallery_components["data"]],
-            outputs=[start_over_btn]
-        ).then(
-            fn=lambda: (gr.update(visible=False), None, "", ""),
-            outputs=[edit_modal, edit_current_index, edit_title, edit_description]
+            outputs=export_section_outputs
         )
         
-        # Wire up delete button events for each card
-        for idx, card in enumerate(gallery_components["card_components"]):
-            def create_delete_function(card_idx):
-                def delete_specific_card(gallery_data):
-                    if card_idx < len(gallery_data):
-                        print(f"Deleting card at index: {card_idx} title: {gallery_data[card_idx]['title']}")
-                        # Check if this card has a 3D asset that will be removed
-                        has_3d_asset = gallery_data[card_idx].get("glb_path") and gallery_data[card_idx]["glb_path"]
-                        if has_3d_asset:
-                            print(f"Removing 3D asset: {gallery_data[card_idx]['glb_path']}")
-                        
-                        # Remove the card from gallery data
-                        updated_data = [item for i, item in enumerate(gallery_data) if i != card_idx]
-                        return updated_data
-                    else:
-                        print(f"Card index {card_idx} out of range")
-                        return gallery_data
-                return delete_specific_card
+        def start_convert_all(gallery_data):
+            """First stage of convert all: mark items as batch processing."""
+            if not gallery_data:
+                return gallery_data
+            return disable_buttons_handler(gallery_data)
+        
+        def convert_all_flow(gallery_data, workspace_mode):
+            """Convert every unconverted card to 3D, streaming progress as cards finish."""
+            gallery_data = start_convert_all(gallery_data)
+            yield (
+                gallery_data,
+                *gallery_components["shift_card_ui"](gallery_data),
+                *[gr.update()] * len(export_section_outputs),
+                update_start_over_state(gallery_data, workspace_mode),  # immediately disable Start Over during batch
+            )
+            
+            result = gallery_data
+            # The handler already coalesces its progress updates
+            for result in convert_all_handler(gallery_data):
+                yield (
+                    result,
+                    *gallery_components["shift_card_ui"](result),
+                    *update_export_section(result),
+                    gr.update(),
+                )
             
-            card["delete_btn"].click(
-                fn=create_delete_function(idx),
-                inputs=[gallery_components["data"]],
-                outputs=[gallery_components["data"]]
-            ).then(
-                fn=gallery_components["shift_card_ui"],
-                inputs=[gallery_components["data"]],
-                outputs=gallery_components["get_all_card_outputs"]()
-            ).then(
-                fn=update_export_section,
-                inputs=[gallery_components["data"]],
-                outputs=[export_components["count_display"], export_components["thumbnails_container"], export_components["export_btn"], export_components["placeholder"], export_components["export_content_active"]]
+            yield (
+                result,
+                *gallery_components["shift_card_ui"](result),
+                *refresh_export_and_start_over(result, workspace_mode),
             )
         
-        # Wire up convert all to 3D button (two-stage process)
+        # Wire up convert all to 3D button as a single streamed event
         gallery_components["convert_all_btn"].click(
-            fn=disable_buttons_handler,
-            inputs=[gallery_components["data"]],
-            outputs=[gallery_components["data"]]
-        ).then(
-            fn=gallery_components["shift_card_ui"],
-            inputs=[gallery_components["data"]],
-            outputs=gallery_components["get_all_card_outputs"]()
-        ).then(
-            fn=update_start_over_state,                  # immediately disable Start Over during batch
-            inputs=[gallery_components["data"]],
-            outputs=[start_over_btn]
-        ).then(
-            fn=convert_all_handler,
-            inputs=[gallery_components["data"]],
-            outputs=[gallery_components["data"]]
-        ).then(
-            fn=gallery_components["shift_card_ui"],
-            inputs=[gallery_components["data"]],
-            outputs=gallery_components["get_all_card_outputs"]()
-        ).then(
-            fn=update_export_section,
-            inputs=[gallery_components["data"]],
-            outputs=[export_components["count_display"], export_components["thumbnails_container"], export_components["export_btn"], export_components["placeholder"], export_components["export_content_active"]]
-        ).then(
-            fn=update_start_over_state,
-            inputs=[gallery_components["data"]],
-            outputs=[start_over_btn]
+            fn=convert_all_flow,
+            inputs=[gallery_components["data"], in_workspace_mode],
+            outputs=[gallery_components["data"]] + all_card_outputs + export_section_outputs + [start_over_btn]
         )
         
         # Wire up export button to open modal
@@ -1394,29 +1391,19 @@ if __name__ == "__main__":
                 except Exception as e:
                     print(f"Error stopping termination server: {e}")
             
-            # Stop the LLM NIM process if it's running
-            if _nim_process and _nim_process.poll() is None:
-                print("Stopping LLM NIM process...")
-                try:
-                    _nim_process.terminate()
-                    _nim_process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    print("LLM NIM process didn't stop gracefully, forcing...")
-                    _nim_process.kill()
-                except Exception as e:
-                    print(f"Error stopping LLM NIM process: {e}")
-            
-            # Stop the Trellis NIM process if it's running
-            if _trellis_process and _trellis_process.poll() is None:
-                print("Stopping Trellis NIM process...")
+            # Stop the NIM runner processes this app started, if still running
+            for process in _child_processes:
+                if process.poll() is not None:
+                    continue
+                print(f"Stopping child process {process.pid} ({process.args[-1]})...")
                 try:
-                    _trellis_process.terminate()
-                    _trellis_process.wait(timeout=5)
+                    process.terminate()
+                    process.wait(timeout=5)
                 except subprocess.TimeoutExpired:
-                    print("Trellis NIM process didn't stop gracefully, forcing...")
-                    _trellis_process.kill()
+                    print(f"Child process {process.pid} didn't stop gracefully, forcing...")
+                    process.kill()
                 except Exception as e:
-                    print(f"Error stopping Trellis NIM process: {e}")
+                    print(f"Error stopping child process {process.pid}: {e}")
             
             # Stop both NIM containers
             print("Stopping LLM NIM container...")
@@ -1429,4 +1416,5 @@ if __name__ == "__main__":
         except Exception as e:
             print(f"Error during cleanup: {e}")
         finally:
-            print("Application shutdown complete") 
\ No newline at end of file
+            print("Application shutdown complete")
+            _log_listener.stop()
\ No newline at end of file
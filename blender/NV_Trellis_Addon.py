@@ -26,38 +26,121 @@ bl_info = {
 
 import bpy
 import os
+import stat
+import json
 import subprocess
 import threading
+import asyncio
 import time
 import logging
-import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
 import platform
-import urllib.request
+from collections import namedtuple
 from bpy.types import Operator, Panel, AddonPreferences
 from bpy.props import StringProperty, EnumProperty
+from bpy.app.handlers import persistent
 
 # Set up logging to file and console
 log_file = os.path.join(os.path.expanduser("~"), "trellis_addon.log")
 logger = logging.getLogger(__name__)
 
-# Global variables for status
-llm_status = "NOT READY"
-trellis_status = "NOT READY"
-gradio_status = "NOT READY"
+class ServiceStatus(namedtuple("ServiceStatus", ["llm", "trellis", "gradio"])):
+    """Immutable snapshot of the LLM, Trellis and Gradio service statuses."""
+    __slots__ = ()
+
+    @property
+    def all_ready(self):
+        return self.llm == "READY" and self.trellis == "READY" and self.gradio == "READY"
+
+ALL_NOT_READY = ServiceStatus("NOT READY", "NOT READY", "NOT READY")
+
+# Global variables for status; service_status is replaced as a whole, only on Blender's
+# main thread (by the status poll timer and the operator), so readers need no lock
+service_status = ALL_NOT_READY
 starting_services = False
-llm_status_lock = threading.Lock()
-trellis_status_lock = threading.Lock()
-gradio_status_lock = threading.Lock()
+stopping_services = False
 starting_services_lock = threading.Lock()
-stop_thread = False
-log_output_stop = threading.Event()
+
+# Endpoints probed for service status (the same ones check_services.py uses)
+NIM_HEALTH_PATH = "/v1/health/ready"
+LLM_HOST, LLM_PORT = "localhost", 19002
+TRELLIS_HOST, TRELLIS_PORT = "localhost", 8000
+GRADIO_HOST, GRADIO_PORT = "127.0.0.1", 7860
+# Seconds a probe waits for a service's port to accept before reporting it NOT READY
+HEALTH_CONNECT_TIMEOUT = 0.25
+# The three HTTP probes run concurrently, so a status check takes as long as the slowest one
+_probe_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="trellis-probe")
+
+# Seconds between service status probes
+STATUS_POLL_INTERVAL = 10
+# While services are starting, probes start this often and back off to the maximum,
+# so readiness shows up within a couple of seconds rather than up to 10
+STARTING_POLL_MIN_INTERVAL = 0.25
+STARTING_POLL_MAX_INTERVAL = 2
+_starting_poll_interval = None
+# Seconds after a start request that the fast cadence is kept while waiting for the NIMs
+READINESS_TIMEOUT = 300
+# time.monotonic() deadline while a start is awaiting readiness, else None. This outlives
+# starting_services, which only covers spawning app.py. Main thread only.
+_readiness_deadline = None
+# Blocking status probes run on this worker so the timer never stalls Blender's UI
+_status_executor = None
+_status_future = None
+
+# Resolved trellis Python paths keyed by (CONDA_PREFIX, user python_path),
+# and the (mtime, size) of interpreters that were found not to run
+_python_path_cache = {}
+_rejected_pythons = {}
+
+# Longest app.py output line kept in the log; download progress bars write \r without
+# a newline, so a single "line" can grow well past asyncio's 64 KiB default
+APP_OUTPUT_LINE_LIMIT = 16 * 1024 * 1024
+
+# Logger methods for the level names app.py writes
+_LOG_LEVEL_METHODS = {
+    "DEBUG": logger.debug,
+    "INFO": logger.info,
+    "WARNING": logger.warning,
+    "ERROR": logger.error,
+}
+
+def _log_level_of(line):
+    """Return the level name of an app.py output line, or None if it has none.
+    
+    app.py logs as 'asctime - levelname - message'; other tools (e.g. uvicorn)
+    print 'LEVEL: message'.
+    """
+    parts = line.split(" - ", 2)
+    if len(parts) == 3:
+        return parts[1]
+    return line.split(":", 1)[0]
+
+def log_output_line(line, default_log_func):
+    """Log one line of app.py output at its own level, or with default_log_func if it has none."""
+    _LOG_LEVEL_METHODS.get(_log_level_of(line), default_log_func)(line)
+
+# Add-on preferences reference; see _prefs()
+_prefs_cache = None
 
 # Console handler for dynamic level adjustment
 console_handler = logging.StreamHandler()
 
+def _prefs():
+    """Return this add-on's preferences, resolving them only once per loaded file."""
+    global _prefs_cache
+    if _prefs_cache is None:
+        _prefs_cache = bpy.context.preferences.addons[__name__].preferences
+    return _prefs_cache
+
+@persistent
+def _clear_prefs_cache(*args):
+    """load_post handler: drop the cached preferences reference."""
+    global _prefs_cache
+    _prefs_cache = None
+
 def update_logging_level():
     """Update the console handler's logging level based on user preference."""
-    addon_prefs = bpy.context.preferences.addons[__name__].preferences
+    addon_prefs = _prefs()
     log_level_str = addon_prefs.console_log_level
     log_level = {
         "ERROR": logging.ERROR,
@@ -84,209 +167,330 @@ def setup_logging():
     
     update_logging_level()
 
+_IS_WINDOWS = platform.system() == "Windows"
+
+# Location of the interpreter inside a conda env
+_PY_EXE_REL = "python.exe" if _IS_WINDOWS else os.path.join("bin", "python")
+
+# Path ending shared by every trellis env location (<conda root>/envs/trellis)
+_TRELLIS_ENV_SUFFIX = os.sep + os.path.join("envs", "trellis")
+
+def _run(args, **kwargs):
+    """subprocess.run for the add-on's helper commands.
+    
+    The child gets no stdin and none of Blender's other handles. On Windows it shares
+    Blender's console if there is one, and otherwise gets a hidden one instead of a
+    window flashing up; elsewhere it runs in its own session, so Ctrl-C in Blender's
+    terminal is not delivered to it.
+    """
+    kwargs.setdefault("stdin", subprocess.DEVNULL)
+    kwargs.setdefault("close_fds", True)
+    if _IS_WINDOWS:
+        # Unlike CREATE_NO_WINDOW, this doesn't start a new conhost when Blender has a console
+        kwargs.setdefault("startupinfo", subprocess.STARTUPINFO(dwFlags=subprocess.STARTF_USESHOWWINDOW, wShowWindow=subprocess.SW_HIDE))
+    else:
+        kwargs.setdefault("start_new_session", True)
+    return subprocess.run(args, **kwargs)
+
+def _python_in_env(env_path):
+    """Return the path of the interpreter inside a conda env directory."""
+    return os.path.normpath(os.path.join(env_path, _PY_EXE_REL))
+
+def _python_fingerprint(python_path):
+    """Return (mtime, size) of an interpreter file, used to notice when it changes.
+    
+    Returns None if python_path is not a regular file.
+    """
+    try:
+        st = os.stat(python_path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def _is_valid_python(python_path):
+    """Check that python_path is an executable file that has not already failed to run.
+    
+    The interpreter is not launched here; it is only probed if it fails at first use.
+    """
+    # One stat answers both "is it a file" and "has it changed since it was rejected"
+    fingerprint = _python_fingerprint(python_path)
+    if fingerprint is None or not os.access(python_path, os.X_OK):
+        return False
+    return _rejected_pythons.get(python_path) != fingerprint
+
+def _verify_python(python_path):
+    """Run python_path once; if it does not work, remember that until the file changes."""
+    try:
+        result = _run(
+            [python_path, "-c", "import sys; print(sys.version)"],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        if result.returncode == 0:
+            return True
+    except Exception as e:
+        logger.debug("Failed to run Python at %s: %s", python_path, str(e))
+    logger.warning("Python executable does not run: %s", python_path)
+    fingerprint = _python_fingerprint(python_path)
+    if fingerprint is not None:
+        _rejected_pythons[python_path] = fingerprint
+    # Forget any resolution that picked it so the next lookup searches again
+    for key, cached_path in list(_python_path_cache.items()):
+        if cached_path == python_path:
+            del _python_path_cache[key]
+    return False
+
 def get_conda_python_path():
     """Attempt to find the Conda 'trellis' environment's Python executable."""
-    addon_prefs = bpy.context.preferences.addons[__name__].preferences
+    addon_prefs = _prefs()
     user_python_path = addon_prefs.python_path.strip()
 
-    # Step 1: Check CONDA_PREFIX
-    conda_prefix = os.environ.get("CONDA_PREFIX")
-    if conda_prefix and os.path.isdir(conda_prefix):
-        if os.path.basename(conda_prefix) == "trellis" and os.path.basename(os.path.dirname(conda_prefix)) == "envs":
-            conda_base = os.path.dirname(os.path.dirname(conda_prefix))
-        else:
-            conda_base = conda_prefix
-        if platform.system() == "Windows":
-            python_path = os.path.normpath(os.path.join(conda_base, "envs", "trellis", "python.exe"))
-        else:
-            python_path = os.path.join(conda_base, "envs", "trellis", "bin", "python")
-        if os.path.isfile(python_path):
-            try:
-                result = subprocess.run(
-                    [python_path, "-c", "import sys; print(sys.version)"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    logger.info("Using Python path from CONDA_PREFIX: %s", python_path)
-                    return python_path
-            except Exception as e:
-                logger.debug("Failed to verify Python path from CONDA_PREFIX: %s", str(e))
-
-    # Step 2: Check ~/.conda/environments.txt
-    env_file = os.path.join(os.path.expanduser("~"), ".conda", "environments.txt")
-    if os.path.isfile(env_file):
-        try:
-            with open(env_file, 'r') as f:
-                for line in f:
-                    env_path = line.strip()
-                    if env_path and os.path.basename(env_path) == "trellis" and os.path.basename(os.path.dirname(env_path)) == "envs":
-                        logger.debug("Found trellis environment in environments.txt: %s", env_path)
-                        if platform.system() == "Windows":
-                            python_path = os.path.normpath(os.path.join(env_path, "python.exe"))
-                        else:
-                            python_path = os.path.join(env_path, "bin", "python")
-                        if os.path.isfile(python_path):
-                            try:
-                                result = subprocess.run(
-                                    [python_path, "-c", "import sys; print(sys.version)"],
-                                    capture_output=True,
-                                    text=True,
-                                    timeout=5
-                                )
-                                if result.returncode == 0:
-                                    logger.info("Found Python executable from environments.txt: %s", python_path)
-                                    return python_path
-                            except Exception as e:
-                                logger.debug("Failed to verify Python from environments.txt: %s", str(e))
-        except Exception as e:
-            logger.warning("Failed to read environments.txt: %s", str(e))
-
-    # Step 3: Check user-supplied python_path
-    if user_python_path and os.path.isfile(user_python_path):
+    # The preference holds the user's choice or the path found in an earlier session,
+    # so when it is still valid no search is needed
+    if user_python_path:
         try:
-            result = subprocess.run(
-                [user_python_path, "-c", "import sys; print(sys.version)"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                logger.info("Using user-provided Python path: %s", user_python_path)
+            if _is_valid_python(user_python_path):
+                logger.debug("Using Python path from add-on preferences: %s", user_python_path)
                 return user_python_path
-            else:
-                logger.warning("User-provided Python path is invalid: %s", user_python_path)
+            logger.warning("User-provided Python path is invalid: %s", user_python_path)
         except Exception as e:
             logger.warning("Failed to verify user-provided Python path: %s", str(e))
 
-    # Step 4: Check 'conda info --base'
-    conda_exe = shutil.which("conda")
-    if not conda_exe:
-        default_conda_base = os.path.expanduser("~/Miniconda3")
-        conda_exe = os.path.join(default_conda_base, "Scripts", "conda.exe") if platform.system() == "Windows" else os.path.join(default_conda_base, "bin", "conda")
-        if not os.path.isfile(conda_exe):
-            conda_exe = None
-    if conda_exe:
-        try:
-            result = subprocess.run(
-                [conda_exe, "info", "--base"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                conda_base = result.stdout.strip()
-                if platform.system() == "Windows":
-                    python_path = os.path.normpath(os.path.join(conda_base, "envs", "trellis", "python.exe"))
-                else:
-                    python_path = os.path.join(conda_base, "envs", "trellis", "bin", "python")
-                if os.path.isfile(python_path):
-                    try:
-                        result = subprocess.run(
-                            [python_path, "-c", "import sys; print(sys.version)"],
-                            capture_output=True,
-                            text=True,
-                            timeout=5
-                        )
-                        if result.returncode == 0:
-                            logger.info("Using Python path from 'conda info --base': %s", python_path)
-                            return python_path
-                    except Exception as e:
-                        logger.debug("Failed to verify Python path from conda info: %s", str(e))
-        except (subprocess.SubprocessError, FileNotFoundError) as e:
-            logger.debug("Failed to locate Conda base using 'conda info --base': %s", str(e))
-
-    # Step 5: Fallback to default
-    default_conda_base = os.path.expanduser("~/Miniconda3")
-    if platform.system() == "Windows":
-        python_path = os.path.normpath(os.path.join(default_conda_base, "envs", "trellis", "python.exe"))
-    else:
-        python_path = os.path.join(default_conda_base, "envs", "trellis", "bin", "python")
-    if os.path.isfile(python_path):
+    cache_key = (os.environ.get("CONDA_PREFIX"), user_python_path)
+    python_path = _python_path_cache.get(cache_key)
+    if python_path and os.path.isfile(python_path):
+        return python_path
+
+    python_path = _find_conda_python_path()
+    if python_path:
+        if not user_python_path and threading.current_thread() is threading.main_thread():
+            # Persist the result so the next Blender session can use it directly
+            addon_prefs.python_path = python_path
+        # Cached after persisting, since editing the preference clears the cache
+        _python_path_cache[cache_key] = python_path
+    return python_path
+
+def _envs_from_conda_prefix():
+    """Yield the trellis env next to the active conda env (or inside it, if it is the base)."""
+    conda_prefix = os.environ.get("CONDA_PREFIX")
+    if conda_prefix and os.path.isdir(conda_prefix):
+        if conda_prefix.endswith(_TRELLIS_ENV_SUFFIX):
+            conda_prefix = conda_prefix[:-len(_TRELLIS_ENV_SUFFIX)]
+        yield os.path.join(conda_prefix, "envs", "trellis")
+
+def _envs_from_environments_txt():
+    """Yield the trellis envs listed in ~/.conda/environments.txt."""
+    env_file = os.path.join(os.path.expanduser("~"), ".conda", "environments.txt")
+    if not os.path.isfile(env_file):
+        return
+    # Read lazily so the rest of the file is skipped once a listed env is accepted
+    with open(env_file, 'r') as f:
+        for line in f:
+            env_path = line.rstrip()
+            if env_path.endswith(_TRELLIS_ENV_SUFFIX):
+                logger.debug("Found trellis environment in environments.txt: %s", env_path)
+                yield env_path
+
+# Trellis envs reported by 'conda info --json', kept once conda has listed one
+_conda_info_envs = None
+
+def _envs_from_conda_info():
+    """Yield the trellis envs conda knows about ('conda info --json' lists every env, wherever it lives)."""
+    global _conda_info_envs
+    if _conda_info_envs is None:
+        import shutil
+        conda_exe = shutil.which("conda")
+        if not conda_exe:
+            default_conda_base = os.path.expanduser("~/Miniconda3")
+            conda_exe = os.path.join(default_conda_base, "Scripts", "conda.exe") if _IS_WINDOWS else os.path.join(default_conda_base, "bin", "conda")
+            if not os.path.isfile(conda_exe):
+                return
+        result = _run(
+            [conda_exe, "info", "--json"],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        if result.returncode != 0 or not result.stdout.strip():
+            return
+        conda_info = json.loads(result.stdout)
+        env_paths = [env for env in conda_info.get("envs", []) if os.path.basename(env) == "trellis"]
+        if conda_info.get("root_prefix"):
+            env_paths.append(os.path.join(conda_info["root_prefix"], "envs", "trellis"))
+        if not env_paths:
+            return
+        _conda_info_envs = env_paths
+    yield from _conda_info_envs
+
+def _envs_default():
+    """Yield the trellis env of the default Miniconda install."""
+    yield os.path.join(os.path.expanduser("~/Miniconda3"), "envs", "trellis")
+
+# Where to look for the trellis env, in order
+_PYTHON_SOURCES = (
+    ("CONDA_PREFIX", _envs_from_conda_prefix),
+    ("environments.txt", _envs_from_environments_txt),
+    ("'conda info --json'", _envs_from_conda_info),
+    ("default fallback", _envs_default),
+)
+
+def _find_conda_python_path():
+    """Search the known locations for the trellis environment's Python executable."""
+    for source, find_envs in _PYTHON_SOURCES:
         try:
-            result = subprocess.run(
-                [python_path, "-c", "import sys; print(sys.version)"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                logger.info("Using default fallback Python path: %s", python_path)
-                return python_path
+            for env_path in find_envs():
+                python_path = _python_in_env(env_path)
+                if _is_valid_python(python_path):
+                    logger.info("Using Python path from %s: %s", source, python_path)
+                    return python_path
         except Exception as e:
-            logger.debug("Failed to verify default Python path: %s", str(e))
+            logger.debug("Failed to locate trellis env using %s: %s", source, str(e))
 
     logger.error("Conda Python not found. Ensure the 'trellis' environment is set up correctly.")
     return None
 
-def get_services_status(python_path):
-    """Run check_services.py to get LLM and Trellis status."""
+class HealthConnection:
+    """A kept-alive HTTP connection to one service, reused by every status probe."""
+    
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.conn = None
+        # Serializes probes that overlap
+        self.lock = threading.Lock()
+    
+    def _request(self, method, path):
+        import http.client
+        if self.conn is None:
+            self.conn = http.client.HTTPConnection(self.host, self.port)
+        if self.conn.sock is None:
+            # Connect with a short timeout first: a closed loopback port is refused at once
+            # on Linux, but Windows retries it for about a second per address
+            self.conn.timeout = HEALTH_CONNECT_TIMEOUT
+            self.conn.connect()
+            self.conn.sock.settimeout(5)
+        self.conn.request(method, path)
+        response = self.conn.getresponse()
+        response.read()
+        return response.status
+    
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+    
+    def status(self, method, path):
+        """Send a request and return the response status code.
+        
+        Raises http.client.HTTPException or OSError if the service does not answer.
+        """
+        import http.client
+        with self.lock:
+            reused = self.conn is not None
+            try:
+                try:
+                    return self._request(method, path)
+                except (http.client.HTTPException, OSError):
+                    if not reused:
+                        raise
+                    # The server may have dropped the idle connection; retry once on a new one
+                    self.close()
+                    return self._request(method, path)
+            except Exception:
+                self.close()
+                raise
+
+_llm_health = HealthConnection(LLM_HOST, LLM_PORT)
+_trellis_health = HealthConnection(TRELLIS_HOST, TRELLIS_PORT)
+_gradio_health = HealthConnection(GRADIO_HOST, GRADIO_PORT)
+
+def check_service_health(health, service_name):
+    """Check a NIM readiness endpoint with a GET over its kept-alive connection."""
     try:
-        script_path = os.path.join(bpy.context.preferences.addons[__name__].preferences.base_path, "check_services.py")
-        logger.debug(f"Running check_services.py at: {script_path} with python: {python_path}")
-        result = subprocess.run(
-            [python_path, script_path],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        logger.debug(f"check_services.py return code: {result.returncode}")
-        logger.debug(f"check_services.py stdout: {repr(result.stdout)}")
-        logger.debug(f"check_services.py stderr: {repr(result.stderr)}")
-        output = result.stdout.strip()
-        if output.endswith("ALL_READY"):
-            return "READY", "READY"
-        elif output.endswith("LLM_READY"):
-            return "READY", "NOT READY"
-        elif output.endswith("TRELLIS_READY"):
-            return "NOT READY", "READY"
-        else:
-            return "NOT READY", "NOT READY"
+        status = health.status("GET", NIM_HEALTH_PATH)
+        logger.debug(f"{service_name} HTTP response code: {status}")
+        return "READY" if status == 200 else "NOT READY"
     except Exception as e:
-        logger.debug(f"Failed to check services: {str(e)}")
-        return "NOT READY", "NOT READY"
+        logger.debug(f"{service_name} not ready: {str(e)}")
+        return "NOT READY"
 
 def check_gradio_service():
-    """Check Gradio service status using urllib."""
+    """Check Gradio service status with a HEAD request over a kept-alive connection."""
     try:
-        req = urllib.request.Request('http://127.0.0.1:7860/', method='HEAD')
-        with urllib.request.urlopen(req, timeout=5) as response:
-            logger.debug(f"Gradio HTTP response code: {response.code}")
-            if response.code == 200 or response.code == 302:
-                return "READY"
+        status = _gradio_health.status("HEAD", "/")
+        logger.debug(f"Gradio HTTP response code: {status}")
+        if status == 200 or status == 302:
+            return "READY"
         return "NOT READY"
     except Exception as e:
         logger.debug(f"Failed to check Gradio: {str(e)}")
         return "NOT READY"
 
-def check_services_status():
-    """Thread function to periodically check all services."""
-    global llm_status, trellis_status, gradio_status
-    python_path = get_conda_python_path()
-    while not stop_thread:
-        llm, trellis = get_services_status(python_path)
-        gradio = check_gradio_service()
-        with llm_status_lock:
-            llm_status = llm
-        with trellis_status_lock:
-            trellis_status = trellis
-        with gradio_status_lock:
-            gradio_status = gradio
-        time.sleep(10)
-
-def start_status_threads():
-    """Start the status checking thread."""
-    global check_thread
-    check_thread = threading.Thread(target=check_services_status, daemon=True)
-    check_thread.start()
-
-def stop_status_threads():
-    """Stop the status checking thread."""
-    global stop_thread
-    stop_thread = True
-    if 'check_thread' in globals() and check_thread.is_alive():
-        check_thread.join(timeout=5)
+def probe_services():
+    """Check all services concurrently, returning the (llm, trellis, gradio) statuses."""
+    llm = _probe_executor.submit(check_service_health, _llm_health, "LLM Service")
+    trellis = _probe_executor.submit(check_service_health, _trellis_health, "Trellis Service")
+    gradio = _probe_executor.submit(check_gradio_service)
+    return ServiceStatus(llm.result(), trellis.result(), gradio.result())
+
+def publish_service_status(status):
+    """Replace the status snapshot shown by the panel."""
+    global service_status
+    service_status = status
+
+def poll_services_status():
+    """Timer function that runs the status probe on the worker and publishes its result."""
+    global _status_future
+    if _status_future is None:
+        _status_future = _status_executor.submit(probe_services)
+        return 0.5
+    if not _status_future.done():
+        return 0.5
+    try:
+        publish_service_status(_status_future.result())
+    except Exception as e:
+        logger.debug(f"Failed to check services: {str(e)}")
+    _status_future = None
+    return _next_poll_interval()
+
+def _next_poll_interval():
+    """Return the delay before the next status probe, backing off while services start."""
+    global _starting_poll_interval, _readiness_deadline
+    if _readiness_deadline is not None and (service_status.all_ready or time.monotonic() >= _readiness_deadline):
+        _readiness_deadline = None
+    if _readiness_deadline is None:
+        _starting_poll_interval = None
+        return STATUS_POLL_INTERVAL
+    if _starting_poll_interval is None:
+        _starting_poll_interval = STARTING_POLL_MIN_INTERVAL
+    else:
+        _starting_poll_interval = min(_starting_poll_interval * 2, STARTING_POLL_MAX_INTERVAL)
+    return _starting_poll_interval
+
+def poll_services_soon():
+    """Reschedule the next status probe to run almost immediately."""
+    if bpy.app.timers.is_registered(poll_services_status):
+        bpy.app.timers.unregister(poll_services_status)
+    bpy.app.timers.register(poll_services_status, first_interval=STARTING_POLL_MIN_INTERVAL, persistent=True)
+
+def start_status_polling():
+    """Start periodic status checks."""
+    global _status_executor
+    _status_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trellis-status")
+    bpy.app.timers.register(poll_services_status, first_interval=0.1, persistent=True)
+
+def stop_status_polling():
+    """Stop periodic status checks."""
+    global _status_executor, _status_future
+    if bpy.app.timers.is_registered(poll_services_status):
+        bpy.app.timers.unregister(poll_services_status)
+    if _status_executor:
+        _status_executor.shutdown(wait=False)
+    _status_executor = None
+    _status_future = None
 
 class TrellisAddonPreferences(AddonPreferences):
     bl_idname = __name__
@@ -301,7 +505,8 @@ class TrellisAddonPreferences(AddonPreferences):
     python_path: StringProperty(
         name="Conda Python Path",
         subtype='FILE_PATH',
-        description="Path to the Python executable in the trellis Conda environment"
+        description="Path to the Python executable in the trellis Conda environment",
+        update=lambda self, context: _python_path_cache.clear()
     )
 
     console_log_level: EnumProperty(
@@ -321,107 +526,139 @@ class TrellisAddonPreferences(AddonPreferences):
         layout.prop(self, "python_path")
         layout.prop(self, "console_log_level")
 
+def run_stop_services(base_path):
+    """Run stop_services.bat from base_path directly, without a shell."""
+    if not _IS_WINDOWS:
+        raise OSError("stop_services.bat can only be run on Windows")
+    _run([os.path.join(base_path, "stop_services.bat")], check=True, cwd=base_path)
+
 class TrellisManager:
     def __init__(self):
         self.process = None
-        self.stdout_thread = None
-        self.stderr_thread = None
+        self.reader_thread = None
+        self._loop = None
+        self._reader_task = None
 
     def start_services(self, python_path, base_path):
-        """Start all services using app.py."""
+        """Start all services using app.py.
+        
+        app.py runs as an asyncio subprocess; one thread runs the event loop that
+        spawns it and logs both of its output streams.
+        """
+        started = Future()
+        self.reader_thread = threading.Thread(
+            target=asyncio.run,
+            args=(self._run_app(python_path, base_path, started),),
+            daemon=True
+        )
+        self.reader_thread.start()
         try:
-            script_path = os.path.join(base_path, "app.py")
-            self.process = subprocess.Popen(
-                [python_path, script_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=base_path
-            )
+            started.result()
             logger.info("Services started with PID %d via app.py", self.process.pid)
-
-            def log_output(pipe, log_func):
-                while not log_output_stop.is_set():
-                    try:
-                        line = pipe.readline()
-                        if not line:
-                            break
-                        if "INFO" in line:
-                            logger.info(line.strip())
-                        elif "DEBUG" in line:
-                            logger.debug(line.strip())
-                        elif "WARNING" in line:
-                            logger.warning(line.strip())
-                        else:
-                            log_func(line.strip())
-                    except ValueError as e:
-                        logger.debug(f"Pipe closed while logging: {e}")
-                        break
-                    except Exception as e:
-                        logger.error(f"Error while logging output: {e}")
-                        break
-
-            self.stdout_thread = threading.Thread(
-                target=log_output,
-                args=(self.process.stdout, lambda x: logger.info("app.py stdout: %s", x)),
-                daemon=True
-            )
-            self.stderr_thread = threading.Thread(
-                target=log_output,
-                args=(self.process.stderr, lambda x: logger.error("app.py stderr: %s", x)),
-                daemon=True
-            )
-            self.stdout_thread.start()
-            self.stderr_thread.start()
-
             return True
         except Exception as e:
             logger.error(f"Failed to start services via app.py: {str(e)}")
             return False
 
+    async def _run_app(self, python_path, base_path, started):
+        """Spawn app.py, report the outcome through started, then log its output until EOF or cancellation."""
+        try:
+            self.process = await asyncio.create_subprocess_exec(
+                python_path, os.path.join(base_path, "app.py"),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=base_path,
+                limit=APP_OUTPUT_LINE_LIMIT
+            )
+        except Exception as e:
+            started.set_exception(e)
+            return
+        self._loop = asyncio.get_running_loop()
+        self._reader_task = asyncio.current_task()
+        started.set_result(True)
+        try:
+            await asyncio.gather(
+                self._log_stream(self.process.stdout, lambda x: logger.info("app.py stdout: %s", x)),
+                self._log_stream(self.process.stderr, lambda x: logger.error("app.py stderr: %s", x)),
+            )
+        except asyncio.CancelledError:
+            logger.debug("Stopped logging app.py output")
+
+    @staticmethod
+    async def _log_stream(stream, log_func):
+        """Log lines from one of app.py's output streams until it closes."""
+        while True:
+            try:
+                line = await stream.readline()
+            except (ValueError, asyncio.LimitOverrunError):
+                # readline has already discarded the overlong chunk, so keep draining the pipe
+                logger.debug("Dropped app.py output longer than %d bytes", APP_OUTPUT_LINE_LIMIT)
+                continue
+            if not line:
+                break
+            line = line.decode(errors="replace").strip()
+            if line:
+                log_output_line(line, log_func)
+
     def stop_services(self):
         """Stop all services and clean up resources."""
         if self.process:
-            log_output_stop.set()
-            if self.stdout_thread:
-                self.stdout_thread.join(timeout=5)
-            if self.stderr_thread:
-                self.stderr_thread.join(timeout=5)
-            try:
-                self.process.stdout.close()
-                self.process.stderr.close()
-            except Exception as e:
-                logger.debug(f"Error closing pipes: {e}")
+            # Cancelling the reader lets asyncio.run finish, which closes app.py's pipes
+            if self._loop and self._reader_task:
+                self._loop.call_soon_threadsafe(self._reader_task.cancel)
+            if self.reader_thread:
+                self.reader_thread.join(timeout=5)
             self.process = None
-            self.stdout_thread = None
-            self.stderr_thread = None
-            log_output_stop.clear()
+            self.reader_thread = None
+            self._loop = None
+            self._reader_task = None
 
-# Global variable to store service start result
+# The manager that owns the running app.py, shared by the start and stop paths
+trellis_manager = TrellisManager()
+
+# Global variables to store service start/stop results
 service_start_result = None
+service_stop_result = None
 
 def check_service_start_result():
     """Timer function to check the result of service startup and report it."""
-    global service_start_result
+    global service_start_result, _readiness_deadline
     if service_start_result is not None:
+        if not service_start_result:
+            # Nothing is coming up, so drop back to the normal cadence
+            _readiness_deadline = None
         # Trigger UI redraw
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        redraw_status_panel()
         # Report result using a new operator
         bpy.ops.trellis.report_service_status('INVOKE_DEFAULT', success=service_start_result)
         service_start_result = None
         return None  # Stop the timer
     return 0.1  # Continue checking
 
+def check_service_stop_result():
+    """Timer function to check the result of stopping the services and report it."""
+    global service_stop_result
+    if service_stop_result is not None:
+        redraw_status_panel()
+        bpy.ops.trellis.report_service_status('INVOKE_DEFAULT', success=service_stop_result, action='STOP')
+        service_stop_result = None
+        return None
+    return 0.1
+
 class TRELLIS_OT_ReportServiceStatus(Operator):
     bl_idname = "trellis.report_service_status"
     bl_label = "Report Service Status"
     
     success: bpy.props.BoolProperty()
+    action: EnumProperty(items=[("START", "Start", ""), ("STOP", "Stop", "")], default="START")
 
     def execute(self, context):
-        if self.success:
+        if self.action == 'STOP':
+            if self.success:
+                self.report({'INFO'}, "All services terminated successfully")
+            else:
+                self.report({'ERROR'}, "Failed to stop services")
+        elif self.success:
             self.report({'INFO'}, "Services started, waiting for readiness...")
         else:
             self.report({'ERROR'}, "Failed to start services via app.py")
@@ -431,42 +668,54 @@ class TRELLIS_OT_ManageTrellis(Operator):
     bl_idname = "trellis.manage_trellis"
     bl_label = "Manage TRELLIS"
 
-    def check_services_ready(self, timeout=300):
-        """Check if all services are ready, with timeout in seconds."""
-        global starting_services
-        start_time = time.time()
-        last_log_time = start_time
-        while time.time() - start_time < timeout:
-            with llm_status_lock, trellis_status_lock, gradio_status_lock:
-                if llm_status == "READY" and trellis_status == "READY" and gradio_status == "READY":
-                    logger.info("All services are ready")
-                    return True
-                current_time = time.time()
-                if current_time - last_log_time >= 5:
-                    logger.info("Services not ready after %d seconds: LLM=%s, Trellis=%s, Gradio=%s",
-                                int(current_time - start_time), llm_status, trellis_status, gradio_status)
-                    last_log_time = current_time
-            time.sleep(1)
-        logger.error("Services failed to start within %d seconds", timeout)
-        return False
-
     def start_services_thread(self, python_path, base_path):
         """Start services in a separate thread and store the result."""
         global starting_services, service_start_result
-        manager = TrellisManager()
-        success = manager.start_services(python_path, base_path)
+        # Stop any existing partial services first; stop_services.bat takes several seconds,
+        # which is why this runs here rather than in execute
+        try:
+            run_stop_services(base_path)
+            logger.info("Existing partial services stopped via stop_services.bat")
+        except Exception as e:
+            logger.warning(f"Failed to stop existing services, continuing with startup: {str(e)}")
+        success = trellis_manager.start_services(python_path, base_path)
+        if not success:
+            # Path resolution doesn't launch the interpreter, so check it now that it failed
+            _verify_python(python_path)
         with starting_services_lock:
             starting_services = False
         # Store the result in a global variable
         service_start_result = success
 
+    def stop_services_thread(self, base_path):
+        """Stop services in a separate thread and store the result."""
+        global stopping_services, service_stop_result
+        success = True
+        try:
+            run_stop_services(base_path)
+            logger.info("Services stopped via stop_services.bat")
+            # Wait briefly for services to become NOT READY
+            start_time = time.time()
+            timeout = 30
+            while time.time() - start_time < timeout:
+                if probe_services() == ALL_NOT_READY:
+                    break
+                time.sleep(1)
+            trellis_manager.stop_services()
+            publish_service_status(ALL_NOT_READY)
+        except Exception as e:
+            logger.error(f"Failed to stop services via stop_services.bat: {str(e)}")
+            success = False
+        with starting_services_lock:
+            stopping_services = False
+        service_stop_result = success
+
     def execute(self, context):
-        global trellis_status, llm_status, gradio_status, starting_services
-        with trellis_status_lock, llm_status_lock, gradio_status_lock, starting_services_lock:
-            overall_status = "READY" if trellis_status == "READY" and llm_status == "READY" and gradio_status == "READY" else "NOT READY"
-            logger.info(f"Current Status is: {overall_status}")
+        global starting_services, stopping_services, _readiness_deadline
+        overall_status = "READY" if service_status.all_ready else "NOT READY"
+        logger.info(f"Current Status is: {overall_status}")
 
-        base_path = bpy.context.preferences.addons[__name__].preferences.base_path
+        base_path = _prefs().base_path
         if not base_path or not os.path.isdir(base_path):
             self.report({'ERROR'}, "Invalid or missing Trellis Base Path")
             return {'CANCELLED'}
@@ -482,55 +731,35 @@ class TRELLIS_OT_ManageTrellis(Operator):
             return {'CANCELLED'}
 
         if overall_status == "READY":
-            # Stop services
-            try:
-                subprocess.run(["stop_services.bat"], shell=True, check=True, cwd=base_path)
-                logger.info("Services stopped via stop_services.bat")
-                # Wait briefly for services to become NOT READY
-                start_time = time.time()
-                timeout = 30
-                while time.time() - start_time < timeout:
-                    with llm_status_lock, trellis_status_lock, gradio_status_lock:
-                        if llm_status == "NOT READY" and trellis_status == "NOT READY" and gradio_status == "NOT READY":
-                            break
-                    time.sleep(1)
-                TrellisManager().stop_services()
-                self.report({'INFO'}, "All services terminated successfully")
-                with trellis_status_lock:
-                    trellis_status = "NOT READY"
-                with llm_status_lock:
-                    llm_status = "NOT READY"
-                with gradio_status_lock:
-                    gradio_status = "NOT READY"
-            except Exception as e:
-                logger.error(f"Failed to stop services via stop_services.bat: {str(e)}")
-                self.report({'ERROR'}, "Failed to stop services")
-                return {'CANCELLED'}
+            # Stop services in a separate thread so Blender stays responsive while they wind down
+            with starting_services_lock:
+                stopping_services = True
+            threading.Thread(
+                target=self.stop_services_thread,
+                args=(base_path,),
+                daemon=True
+            ).start()
+            bpy.app.timers.register(
+                check_service_stop_result,
+                first_interval=0.1,
+                persistent=True
+            )
+            self.report({'INFO'}, "Stopping services...")
         else:
             # Check if services are already running
-            llm, trellis = get_services_status(python_path)
-            gradio = check_gradio_service()
-            if llm == "READY" and trellis == "READY" and gradio == "READY":
-                with llm_status_lock:
-                    llm_status = "READY"
-                with trellis_status_lock:
-                    trellis_status = "READY"
-                with gradio_status_lock:
-                    gradio_status = "READY"
+            status = probe_services()
+            if status.all_ready:
+                publish_service_status(status)
                 logger.info("All services are already ready, skipping startup")
                 self.report({'INFO'}, "All services are already running")
             else:
-                # Stop any existing partial services
-                try:
-                    subprocess.run(["stop_services.bat"], shell=True, check=True, cwd=base_path)
-                    logger.info("Existing partial services stopped via stop_services.bat")
-                except Exception as e:
-                    logger.warning(f"Failed to stop existing services: {str(e)}")
-                    self.report({'WARNING'}, "Failed to stop existing services, continuing with startup")
-
                 # Set starting state
                 with starting_services_lock:
                     starting_services = True
+                # Probe at the starting cadence until every service is READY, starting now
+                # rather than at the end of the current interval
+                _readiness_deadline = time.monotonic() + READINESS_TIMEOUT
+                poll_services_soon()
 
                 # Start services in a separate thread
                 threading.Thread(
@@ -559,14 +788,20 @@ class VIEW3D_PT_CHAT_TO_3D(Panel):
     
     def draw(self, context):
         layout = self.layout
-        addon_prefs = context.preferences.addons[__name__].preferences
         
         layout.label(text="Base Path is set in Add-on Preferences")
         
-        with trellis_status_lock, llm_status_lock, gradio_status_lock, starting_services_lock:
-            overall_status = "READY" if trellis_status == "READY" and llm_status == "READY" and gradio_status == "READY" else "NOT READY"
-            button_text = "Starting Services" if starting_services else ("Services Started .. Click to Terminate" if overall_status == "READY" else "Start Services")
-            button_enabled = not starting_services
+        status = service_status
+        llm_stat, trellis_stat, gradio_stat = status
+        overall_status = "READY" if status.all_ready else "NOT READY"
+        with starting_services_lock:
+            if starting_services:
+                button_text = "Starting Services"
+            elif stopping_services:
+                button_text = "Stopping Services"
+            else:
+                button_text = "Services Started .. Click to Terminate" if overall_status == "READY" else "Start Services"
+            button_enabled = not (starting_services or stopping_services)
         
         row = layout.row()
         row.operator(
@@ -575,22 +810,16 @@ class VIEW3D_PT_CHAT_TO_3D(Panel):
         )
         row.enabled = button_enabled
         
-        with llm_status_lock:
-            llm_stat = llm_status
         layout.label(
             text=f"LLM Service Status: {llm_stat}",
             icon='CHECKMARK' if llm_stat == "READY" else 'ERROR'
         )
         
-        with trellis_status_lock:
-            trellis_stat = trellis_status
         layout.label(
             text=f"Trellis Server Status: {trellis_stat}",
             icon='CHECKMARK' if trellis_stat == "READY" else 'ERROR'
         )
         
-        with gradio_status_lock:
-            gradio_stat = gradio_status
         layout.label(
             text=f"Gradio Web UI Status: {gradio_stat}",
             icon='CHECKMARK' if gradio_stat == "READY" else 'ERROR'
@@ -605,16 +834,34 @@ class VIEW3D_PT_CHAT_TO_3D(Panel):
         ).url = "http://127.0.0.1:7860/?__theme=light"
         button_row.enabled = (gradio_stat == "READY")
 
+def redraw_status_panel():
+    """Tag the 3D view sidebars, where the status panel lives, for redraw."""
+    # No screen in context (e.g. background mode or while minimized): nothing to redraw
+    screen = bpy.context.screen
+    if screen is None:
+        return
+    for area in screen.areas:
+        if area.type == 'VIEW_3D':
+            for region in area.regions:
+                if region.type == 'UI':
+                    region.tag_redraw()
+
+# Last (service_status, starting_services, stopping_services) the panel was redrawn for
+_last_shown_status = None
+
 def update_status_ui():
     """Timer function to refresh the UI with the latest statuses."""
-    global starting_services
-    with llm_status_lock, trellis_status_lock, gradio_status_lock, starting_services_lock:
-        if llm_status == "READY" and trellis_status == "READY" and gradio_status == "READY" and starting_services:
+    global starting_services, _last_shown_status
+    with starting_services_lock:
+        if service_status.all_ready and starting_services:
             logger.info("All services are ready, resetting starting_services")
             starting_services = False
-    for area in bpy.context.screen.areas:
-        if area.type == 'VIEW_3D':
-            area.tag_redraw()
+        shown_status = (service_status, starting_services, stopping_services)
+    # Nothing to repaint unless the statuses or the button state changed
+    if shown_status == _last_shown_status:
+        return 1.0
+    _last_shown_status = shown_status
+    redraw_status_panel()
     return 1.0
 
 classes = (
@@ -631,22 +878,23 @@ def register():
         return
     for cls in classes:
         bpy.utils.register_class(cls)
+    _clear_prefs_cache()
+    bpy.app.handlers.load_post.append(_clear_prefs_cache)
     
     # Set up logging
     setup_logging()
     
     # Attempt to find and store Python path if not set
-    addon_prefs = bpy.context.preferences.addons[__name__].preferences
+    addon_prefs = _prefs()
     if not addon_prefs.python_path.strip():
         python_path = get_conda_python_path()
         if python_path:
-            addon_prefs.python_path = python_path
             logger.info(f"Automatically set Python path to: {python_path}")
         else:
             logger.warning("Could not find Conda Python executable for trellis environment")
     
-    # Start status threads and UI timer
-    start_status_threads()
+    # Start status polling and UI timer
+    start_status_polling()
     try:
         bpy.app.timers.register(update_status_ui, persistent=True)
     except TypeError as e:
@@ -654,21 +902,22 @@ def register():
         raise
 
 def unregister():
-    global log_output_stop
-    log_output_stop.set()
-    
-    base_path = bpy.context.preferences.addons[__name__].preferences.base_path
+    base_path = _prefs().base_path
     try:
-        subprocess.run(["stop_services.bat"], shell=True, check=True, cwd=base_path)
+        run_stop_services(base_path)
         logger.info("Services stopped successfully during unregister")
     except Exception as e:
         logger.warning(f"Failed to stop services during unregister: {str(e)}")
 
-    TrellisManager().stop_services()
+    trellis_manager.stop_services()
+
+    if _clear_prefs_cache in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_clear_prefs_cache)
+    _clear_prefs_cache()
 
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
-    stop_status_threads()
+    stop_status_polling()
     if bpy.app.timers.is_registered(update_status_ui):
         bpy.app.timers.unregister(update_status_ui)
 
@@ -53,9 +53,13 @@
 
 import bpy
 import os
+from mathutils import Matrix
 from bpy.types import Operator, Panel
 from bpy.props import StringProperty, BoolProperty, FloatProperty
 
+# Supported file extensions
+SUPPORTED_EXTENSIONS = frozenset(('.fbx', '.obj', '.glb', '.gltf'))
+
 # Add-on metadata
 bl_info = {
     "name": "Asset Importer",
@@ -67,6 +71,32 @@ bl_info = {
     "category": "Import-Export",
 }
 
+def deselect_all(context):
+    """Deselect all objects through the data API (no operator dispatch or undo step)."""
+    for obj in context.selected_objects:
+        obj.select_set(False)
+
+def apply_uniform_scale(obj, scale_factor):
+    """Set a top-level object's scale to scale_factor and apply it, like transform_apply(scale=True).
+    
+    The object ends with unit scale; its own data and its children's transforms are
+    updated so everything keeps its size and place in the scene.
+    """
+    location, rotation, _ = obj.matrix_basis.decompose()
+    scaled = Matrix.LocRotScale(location, rotation, (scale_factor, scale_factor, scale_factor))
+    unscaled = Matrix.LocRotScale(location, rotation, None)
+
+    # Children keep their world transform now that the parent loses its scale
+    for child in obj.children:
+        parent_inverse = child.matrix_parent_inverse
+        child.matrix_basis = (unscaled @ parent_inverse).inverted() @ scaled @ parent_inverse @ child.matrix_basis
+
+    if obj.type == 'EMPTY':
+        obj.empty_display_size *= scale_factor
+    elif obj.data is not None and hasattr(obj.data, "transform"):
+        obj.data.transform(Matrix.Scale(scale_factor, 4))
+    obj.scale = (1.0, 1.0, 1.0)
+
 # Operator to handle the import process
 class ASSETIMPORTER_OT_import_assets(Operator):
     bl_idname = "assetimporter.import_assets"
@@ -97,9 +127,6 @@ class ASSETIMPORTER_OT_import_assets(Operator):
             bpy.ops.object.mode_set(mode='OBJECT')
             print("Switched to Object Mode.")
 
-        # Supported file extensions
-        supported_extensions = ('.fbx', '.obj', '.glb', '.gltf')
-
         # Initialize cumulative Y-offset (base offset is 2.0 meters)
         base_offset = 2.0
         y_offset = 0.0
@@ -108,15 +135,25 @@ class ASSETIMPORTER_OT_import_assets(Operator):
         skipped_count = 0
         error_count = 0
 
-        for filename in os.listdir(directory):
-            file_path = os.path.join(directory, filename)
+        # Meshes to generate previews for once every file is imported
+        preview_objects = []
+
+        # DirEntry.is_file() uses the type the directory listing already returned,
+        # so files are not stat'ed one by one; sorting keeps the Y-offset order stable
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+
+        for entry in entries:
+            filename = entry.name
+            file_path = entry.path
             file_ext = os.path.splitext(filename)[1].lower()
+            is_file = entry.is_file()
 
-            if os.path.isfile(file_path) and file_ext in supported_extensions:
+            if is_file and file_ext in SUPPORTED_EXTENSIONS:
                 print(f"\nProcessing file: {filename}")
 
                 # Deselect all objects before importing
-                bpy.ops.object.select_all(action='DESELECT')
+                deselect_all(context)
 
                 try:
                     # Import based on file extension
@@ -142,14 +179,8 @@ class ASSETIMPORTER_OT_import_assets(Operator):
 
                     # Apply scaling if enabled
                     if apply_scaling:
-                        top_level_obj.scale = (scale_factor, scale_factor, scale_factor)
+                        apply_uniform_scale(top_level_obj, scale_factor)
                         print(f"  Applied scale factor {scale_factor} to '{top_level_obj.name}'.")
-                        # Apply the scale transform
-                        bpy.ops.object.select_all(action='DESELECT')
-                        top_level_obj.select_set(True)
-                        context.view_layer.objects.active = top_level_obj
-                        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-                        print(f"  Applied scale transform for '{top_level_obj.name}'.")
 
                     # Apply cumulative Y-offset, adjusted by scale factor if scaling is enabled
                     effective_offset = y_offset * scale_factor if apply_scaling else y_offset
@@ -174,7 +205,7 @@ class ASSETIMPORTER_OT_import_assets(Operator):
                     obj_to_process = mesh_objects[0]
 
                     # Deselect all for clean selection
-                    bpy.ops.object.select_all(action='DESELECT')
+                    deselect_all(context)
 
                     # Select the mesh and make it active
                     obj_to_process.select_set(True)
@@ -185,14 +216,13 @@ class ASSETIMPORTER_OT_import_assets(Operator):
                     obj_to_process.name = base_name
                     print(f"  Renamed '{old_name}' to '{base_name}'")
 
-                    # Mark as asset and generate preview
+                    # Mark as asset; its preview is generated after the import loop
                     try:
                         obj_to_process.asset_mark()
                         print(f"  Marked '{base_name}' as an asset.")
-                        obj_to_process.asset_generate_preview()
-                        print(f"  Generated preview for '{base_name}'.")
+                        preview_objects.append(obj_to_process)
                     except Exception as e:
-                        print(f"  Error marking or generating preview for '{base_name}': {e}")
+                        print(f"  Error marking '{base_name}' as an asset: {e}")
                         error_count += 1
 
                     imported_count += 1
@@ -200,12 +230,24 @@ class ASSETIMPORTER_OT_import_assets(Operator):
                 except Exception as e:
                     print(f"Error importing or processing file {filename}: {e}")
                     error_count += 1
-                    bpy.ops.object.select_all(action='DESELECT')
+                    deselect_all(context)
 
-            elif os.path.isfile(file_path):
+            elif is_file:
                 # print(f"Skipping unsupported file type: {filename}")
                 skipped_count += 1
 
+        # Generate the previews in one pass, so the preview renders don't run between imports
+        for obj in preview_objects:
+            try:
+                obj.asset_generate_preview()
+                print(f"  Generated preview for '{obj.name}'.")
+            except Exception as e:
+                print(f"  Error generating preview for '{obj.name}': {e}")
+                error_count += 1
+
+        # Evaluate all the transform changes once
+        context.view_layer.update()
+
         print(f"\n--- Import Process Finished ---")
         print(f"Successfully imported and marked: {imported_count}")
         print(f"Skipped (unsupported type): {skipped_count}")
@@ -21,6 +21,8 @@
 import gradio as gr
 import os
 import base64
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 import io
 import zipfile
@@ -28,6 +30,9 @@ import tempfile
 from pathlib import Path
 from config import ASSETS_DIR
 
+# Shared pool for reading and resizing export thumbnails off the event handler thread
+_THUMBNAIL_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="thumbnail")
+
 def create_blender_export_section():
     """Create the Blender export section interface."""
     
@@ -98,8 +103,66 @@ def create_blender_export_section():
         "export_content_active": export_content_active,
     }
 
+@functools.lru_cache(maxsize=256)
+def _thumbnail_base64(image_path):
+    """Return a 64x64 PNG thumbnail of an image as base64 (generated image paths are never rewritten)."""
+    with Image.open(image_path) as img:
+        # Resize to thumbnail size (64x64)
+        img.thumbnail((64, 64), Image.Resampling.LANCZOS)
+        
+        # Convert to base64 for inline display
+        buffer = io.BytesIO()
+        img.save(buffer, format='PNG')
+        return base64.b64encode(buffer.getvalue()).decode()
+
+def _thumbnail_html(obj):
+    """Build the export thumbnail HTML for one gallery object."""
+    try:
+        # Create thumbnail from original image
+        if obj.get("path") and os.path.exists(obj["path"]):
+            img_base64 = _thumbnail_base64(obj["path"])
+            
+            # Create thumbnail HTML
+            return f"""
+                    <div style='display: inline-block; text-align: center;'>
+                        <img src='data:image/png;base64,{img_base64}' 
+                             alt='{obj["title"]}' 
+                             style='width: 64px; height: 64px; object-fit: cover; border-radius: 8px; border: 2px solid #e0e0e0;'
+                             title='{obj["title"]}'>
+                    </div>
+                    """
+    except Exception as e:
+        print(f"Error creating thumbnail for {obj['title']}: {e}")
+    
+    # Fallback if image not found or could not be read
+    return f"""
+                <div style='display: inline-block; text-align: center;'>
+                    <div style='width: 64px; height: 64px; background-color: #f0f0f0; border-radius: 8px; border: 2px solid #e0e0e0; display: flex; align-items: center; justify-content: center; color: #999; font-size: 12px;'>
+                        {obj["title"][:8]}...
+                    </div>
+                </div>
+                """
+
+# One-slot memo of the last export section render: (signature, outputs)
+_last_export_section = (None, None)
+
 def update_export_section(gallery_data):
-    """Update the export section based on gallery data with 3D assets."""
+    """Update the export section based on gallery data with 3D assets.
+    
+    The outputs depend only on the title and image of each exportable object, so a
+    call with the same set as the previous one returns the previous result.
+    """
+    global _last_export_section
+    signature = tuple((obj["title"], obj.get("path")) for obj in gallery_data or () if obj.get("glb_exists"))
+    last_signature, last_outputs = _last_export_section
+    if signature == last_signature:
+        return last_outputs
+    outputs = _build_export_section(gallery_data)
+    _last_export_section = (signature, outputs)
+    return outputs
+
+def _build_export_section(gallery_data):
+    """Render the export section outputs for the given gallery data."""
     if not gallery_data:
         return (
             gr.update(value="<div style='color: #666; font-size: 14px; margin-bottom: 16px;'>0 objects ready to export</div>"),
@@ -112,7 +175,7 @@ def update_export_section(gallery_data):
     # Filter for objects that have 3D models
     exportable_objects = []
     for obj in gallery_data:
-        if obj.get("glb_path") and os.path.exists(obj["glb_path"]):
+        if obj.get("glb_exists"):
             exportable_objects.append(obj)
     
     count = len(exportable_objects)
@@ -127,52 +190,9 @@ def update_export_section(gallery_data):
             gr.update(visible=False)
         )
     
-    # Generate thumbnails HTML
+    # Generate thumbnails HTML; each thumbnail reads an image file, so they are built in parallel
     thumbnails_html = "<div style='display: flex; flex-wrap: wrap; gap: 8px; margin-bottom: 16px;'>"
-    
-    for obj in exportable_objects:
-        try:
-            # Create thumbnail from original image
-            if obj.get("path") and os.path.exists(obj["path"]):
-                # Read and resize image for thumbnail
-                with Image.open(obj["path"]) as img:
-                    # Resize to thumbnail size (64x64)
-                    img.thumbnail((64, 64), Image.Resampling.LANCZOS)
-                    
-                    # Convert to base64 for inline display
-                    buffer = io.BytesIO()
-                    img.save(buffer, format='PNG')
-                    img_base64 = base64.b64encode(buffer.getvalue()).decode()
-                    
-                    # Create thumbnail HTML
-                    thumbnails_html += f"""
-                    <div style='display: inline-block; text-align: center;'>
-                        <img src='data:image/png;base64,{img_base64}' 
-                             alt='{obj["title"]}' 
-                             style='width: 64px; height: 64px; object-fit: cover; border-radius: 8px; border: 2px solid #e0e0e0;'
-                             title='{obj["title"]}'>
-                    </div>
-                    """
-            else:
-                # Fallback if image not found
-                thumbnails_html += f"""
-                <div style='display: inline-block; text-align: center;'>
-                    <div style='width: 64px; height: 64px; background-color: #f0f0f0; border-radius: 8px; border: 2px solid #e0e0e0; display: flex; align-items: center; justify-content: center; color: #999; font-size: 12px;'>
-                        {obj["title"][:8]}...
-                    </div>
-                </div>
-                """
-        except Exception as e:
-            print(f"Error creating thumbnail for {obj['title']}: {e}")
-            # Fallback thumbnail
-            thumbnails_html += f"""
-            <div style='display: inline-block; text-align: center;'>
-                <div style='width: 64px; height: 64px; background-color: #f0f0f0; border-radius: 8px; border: 2px solid #e0e0e0; display: flex; align-items: center; justify-content: center; color: #999; font-size: 12px;'>
-                    {obj["title"][:8]}...
-                </div>
-            </div>
-            """
-    
+    thumbnails_html += "".join(_THUMBNAIL_EXECUTOR.map(_thumbnail_html, exportable_objects))
     thumbnails_html += "</div>"
     
     # Has 3D assets - hide placeholder, show export content
@@ -222,7 +242,7 @@ def open_export_modal(gallery_data):
     # Filter for objects that have 3D models
     exportable_objects = []
     for obj in gallery_data:
-        if obj.get("glb_path") and os.path.exists(obj["glb_path"]):
+        if obj.get("glb_exists"):
             exportable_objects.append(obj)
     
     return gr.update(visible=True)
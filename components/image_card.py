@@ -17,46 +17,50 @@
 
 
 import gradio as gr
+import logging
 import random
 import os
+import time
 from services.image_generation_service import ImageGenerationService
 from services.model_3d_service import Model3DService
 import datetime
 import config
-from utils import clear_image_generation_failure_flags, should_disable_buttons_during_3d_generation
+from utils import (
+    clear_image_generation_failure_flags,
+    replace_item,
+    should_disable_buttons_during_3d_generation,
+    with_overrides,
+    without_field,
+)
+
+logger = logging.getLogger(__name__)
 
 def invalidate_3d_model(gallery_data, card_idx, object_name, context="image change"):
     """Invalidate any existing 3D model for a card when the image has changed."""
-    updated_data = gallery_data.copy()
-    
-    # Invalidate any existing 3D model since the image has changed
-    if "glb_path" in updated_data[card_idx]:
-        print(f"Invalidating existing 3D model for '{object_name}' due to {context}")
-        del updated_data[card_idx]["glb_path"]
-    
-    if "3d_generated" in updated_data[card_idx]:
-        del updated_data[card_idx]["3d_generated"]
-    
-    if "3d_timestamp" in updated_data[card_idx]:
-        del updated_data[card_idx]["3d_timestamp"]
-    
-    if "content_filtered" in updated_data[card_idx]:
-        print(f"Clearing 3D content filtered state for '{object_name}' due to {context}")
-        del updated_data[card_idx]["content_filtered"]
-    
-    if "content_filtered_timestamp" in updated_data[card_idx]:
-        del updated_data[card_idx]["content_filtered_timestamp"]
+    obj = gallery_data[card_idx]
+    if "glb_path" in obj:
+        logger.debug("Invalidating existing 3D model for '%s' due to %s", object_name, context)
+    if "content_filtered" in obj:
+        logger.debug("Clearing 3D content filtered state for '%s' due to %s", object_name, context)
     
-    # Reset 3D generation state to allow new generation
-    updated_data[card_idx]["3d_generating"] = False
+    # Drop the 3D model, its content filter state and any batch flag, and reset the 3D
+    # generation state to allow new generation. Items are shared between snapshots,
+    # so the card is replaced rather than edited in place.
+    invalidated = without_field(
+        obj,
+        "glb_path", "glb_exists", "3d_generated", "3d_timestamp",
+        "content_filtered", "content_filtered_timestamp", "batch_processing",
+    )
+    updated_data = list(gallery_data)
+    updated_data[card_idx] = with_overrides(invalidated, {"3d_generating": False})
     
-    # Clear batch processing flag if it was set
-    if "batch_processing" in updated_data[card_idx]:
-        del updated_data[card_idx]["batch_processing"]
-    
-    print(f"3D model invalidated - '→ 3D' button re-enabled")
+    logger.debug("3D model invalidated - '→ 3D' button re-enabled")
     return updated_data
 
+def _clear_batch_flags(gallery_data):
+    """Clear the batch processing and global 3D generation flags on every item."""
+    return [without_field(with_overrides(obj, {"batch_processing": False}), "3d_generation_global") for obj in gallery_data]
+
 def create_convert_all_3d_handler(model_3d_service):
     """Create a handler that converts all unconverted images to 3D models."""
     
@@ -65,50 +69,52 @@ def create_convert_all_3d_handler(model_3d_service):
         if not gallery_data:
             return gallery_data
         
-        updated_data = gallery_data.copy()
-        
         # Mark all items as being processed in batch mode to disable all buttons
-        for idx, obj in enumerate(updated_data):
-            updated_data[idx]["batch_processing"] = True
-            
-            # Also mark for global 3D generation if VRAM threshold is met
-            if should_disable_buttons_during_3d_generation():
-                updated_data[idx]["3d_generation_global"] = True
+        fields = {"batch_processing": True}
+        
+        # Also mark for global 3D generation if VRAM threshold is met
+        if should_disable_buttons_during_3d_generation():
+            fields["3d_generation_global"] = True
         
-        print(f"Disabled all buttons for {len(gallery_data)} items during batch 3D conversion")
+        updated_data = [with_overrides(obj, fields) for obj in gallery_data]
+        
+        logger.debug("Disabled all buttons for %s items during batch 3D conversion", len(gallery_data))
         return updated_data
     
     def perform_batch_3d_conversion(gallery_data):
-        """Second stage: perform the actual 3D conversion."""
+        """Second stage: perform the actual 3D conversion.
+        
+        This is a generator that yields progress as items are converted, at most once
+        per config.UI_PROGRESS_THROTTLE_INTERVAL; the last value yielded is always the
+        final state.
+        """
         try:
             if not gallery_data:
-                print("No gallery data to process")
-                return gallery_data
+                logger.debug("No gallery data to process")
+                yield gallery_data
+                return
             
-            updated_data = gallery_data.copy()
+            updated_data = list(gallery_data)
             converted_count = 0
             total_unconverted = 0
             
-            print(f"Starting batch 3D conversion for {len(gallery_data)} items...")
+            logger.info("Starting batch 3D conversion for %s items...", len(gallery_data))
             
             # First pass: identify unconverted items and mark them as generating
             for idx, obj in enumerate(updated_data):
                 if not obj.get("glb_path") and not obj.get("3d_generating", False) and not obj.get("content_filtered", False):
-                    updated_data[idx]["3d_generating"] = True
+                    updated_data[idx] = with_overrides(obj, {"3d_generating": True})
                     total_unconverted += 1
-                    print(f" Queued '{obj['title']}' for 3D conversion")
+                    logger.debug("Queued '%s' for 3D conversion", obj['title'])
             
             if total_unconverted == 0:
-                print("All items already have 3D models or are being generated")
-                # Clear batch_processing flag for all items
-                for idx in range(len(updated_data)):
-                    updated_data[idx]["batch_processing"] = False
-                    # Also clear global 3D generation flag
-                    if "3d_generation_global" in updated_data[idx]:
-                        del updated_data[idx]["3d_generation_global"]
-                return updated_data
+                logger.debug("All items already have 3D models or are being generated")
+                # Clear batch_processing and global 3D generation flags for all items
+                yield _clear_batch_flags(updated_data)
+                return
             
-            print(f"Converting {total_unconverted} items to 3D...")
+            logger.info("Converting %s items to 3D...", total_unconverted)
+            last_yield = time.monotonic()
             
             # Second pass: generate 3D models for each unconverted item
             for idx, obj in enumerate(updated_data):
@@ -116,7 +122,7 @@ def create_convert_all_3d_handler(model_3d_service):
                     object_name = obj["title"]
                     image_path = obj["path"]
                     
-                    print(f"  Converting '{object_name}' to 3D...")
+                    logger.debug("Converting '%s' to 3D...", object_name)
                     
                     # Set output directory for generated 3D models
                     output_dir = config.MODELS_DIR
@@ -129,46 +135,49 @@ def create_convert_all_3d_handler(model_3d_service):
                     
                     if success and glb_path:
                         # Update the gallery data with the 3D model path
-                        updated_data[idx]["glb_path"] = glb_path
-                        updated_data[idx]["3d_generated"] = True
-                        updated_data[idx]["3d_timestamp"] = datetime.datetime.now().isoformat()
-                        updated_data[idx]["3d_generating"] = False  # Mark as complete
+                        updated_data[idx] = with_overrides(obj, {
+                            "glb_path": glb_path,
+                            "glb_exists": True,  # Written by the service; lets the UI skip stat() calls
+                            "3d_generated": True,
+                            "3d_timestamp": datetime.datetime.now().isoformat(),
+                            "3d_generating": False,  # Mark as complete
+                        })
                         converted_count += 1
-                        print(f"  Successfully converted '{object_name}' to 3D: {glb_path}")
+                        logger.info("Successfully converted '%s' to 3D: %s", object_name, glb_path)
                     elif message == "CONTENT_FILTERED":
                         # Handle content filtered case
-                        updated_data[idx]["3d_generating"] = False
-                        updated_data[idx]["content_filtered"] = True
-                        updated_data[idx]["content_filtered_timestamp"] = datetime.datetime.now().isoformat()
-                        print(f"   Content filtered for '{object_name}' - inappropriate content detected")
+                        updated_data[idx] = with_overrides(obj, {
+                            "3d_generating": False,
+                            "content_filtered": True,
+                            "content_filtered_timestamp": datetime.datetime.now().isoformat(),
+                        })
+                        logger.warning("Content filtered for '%s' - inappropriate content detected", object_name)
                     else:
                         # Mark generation as failed
-                        updated_data[idx]["3d_generating"] = False
-                        print(f"  Failed to convert '{object_name}' to 3D: {message}")
+                        updated_data[idx] = with_overrides(obj, {"3d_generating": False})
+                        logger.warning("Failed to convert '%s' to 3D: %s", object_name, message)
+                    
+                    # Report progress, coalescing items that finish in quick succession;
+                    # the batch flags stay set until the final pass
+                    now = time.monotonic()
+                    if now - last_yield >= config.UI_PROGRESS_THROTTLE_INTERVAL:
+                        last_yield = now
+                        yield list(updated_data)
             
-            # Final pass: clear batch_processing flag for all items
-            for idx in range(len(updated_data)):
-                updated_data[idx]["batch_processing"] = False
-                # Also clear global 3D generation flag
-                if "3d_generation_global" in updated_data[idx]:
-                    del updated_data[idx]["3d_generation_global"]
+            # Final pass: clear batch_processing and global 3D generation flags for all items
+            updated_data = _clear_batch_flags(updated_data)
             
-            print(f"Batch 3D conversion complete: {converted_count}/{total_unconverted} items converted")
-            return updated_data
+            logger.info("Batch 3D conversion complete: %s/%s items converted", converted_count, total_unconverted)
+            yield updated_data
             
         except Exception as e:
-            print(f"Error in batch 3D conversion: {str(e)}")
-            # Reset any items that were marked as generating but failed
-            updated_data = gallery_data.copy()
-            for idx, obj in enumerate(updated_data):
-                if obj.get("3d_generating", False):
-                    updated_data[idx]["3d_generating"] = False
-                # Clear batch_processing flag
-                updated_data[idx]["batch_processing"] = False
-                # Clear global 3D generation flag
-                if "3d_generation_global" in updated_data[idx]:
-                    del updated_data[idx]["3d_generation_global"]
-            return updated_data
+            logger.error("Error in batch 3D conversion: %s", e)
+            # Reset any items that were marked as generating but failed, then clear the batch flags
+            updated_data = [
+                with_overrides(obj, {"3d_generating": False}) if obj.get("3d_generating", False) else obj
+                for obj in gallery_data
+            ]
+            yield _clear_batch_flags(updated_data)
     
     return disable_all_buttons, perform_batch_3d_conversion
 
@@ -217,7 +226,7 @@ def create_refresh_handler(image_generation_service):
         """Refresh the image for a specific card with a new random seed."""
         try:
             if card_idx >= len(gallery_data):
-                print(f"Card index {card_idx} out of range")
+                logger.warning("Card index %s out of range", card_idx)
                 return gallery_data
             
             # Get the current object data
@@ -227,7 +236,7 @@ def create_refresh_handler(image_generation_service):
             
             # Validate that we have the required data
             if not object_name or not prompt:
-                print(f"Missing required data for card {card_idx}: title='{object_name}', prompt='{prompt}'")
+                logger.warning("Missing required data for card %s: title='%s', prompt='%s'", card_idx, object_name, prompt)
                 return gallery_data
             
             # Generate a new random seed
@@ -237,8 +246,8 @@ def create_refresh_handler(image_generation_service):
             import config
             output_dir = config.GENERATED_IMAGES_DIR
             
-            print(f"Refreshing image for '{object_name}' with seed {new_seed}")
-            print(f"   Prompt: {prompt}")
+            logger.debug("Refreshing image for '%s' with seed %s", object_name, new_seed)
+            logger.debug("Prompt: %s", prompt)
             
             # Generate new image using SANA service
             success, message, new_image_path = image_generation_service.generate_image_from_prompt(
@@ -255,48 +264,43 @@ def create_refresh_handler(image_generation_service):
             
             if success and new_image_path:
                 # Update the gallery data with the new image path
-                updated_data = gallery_data.copy()
-                updated_data[card_idx]["path"] = new_image_path
-                updated_data[card_idx]["seed"] = new_seed
+                updated_data = replace_item(gallery_data, card_idx, {"path": new_image_path, "seed": new_seed})
                 
                 # Clear any previous failure flags since image generation succeeded
                 updated_data[card_idx] = clear_image_generation_failure_flags(updated_data[card_idx])
                  
                 invalidate_reason = "image update"
-                print(f"Successfully refreshed image: {new_image_path}")
+                logger.info("Successfully refreshed image: %s", new_image_path)
                 
             elif message == "PROMPT_CONTENT_FILTERED":
                 # Handle 2D prompt content filtered case
-                updated_data = gallery_data.copy()
-                updated_data[card_idx]["path"] = "static/images/content_filtered.svg"
-                updated_data[card_idx]["prompt_content_filtered"] = True
-                updated_data[card_idx]["prompt_content_filtered_timestamp"] = datetime.datetime.now().isoformat()
+                updated_data = replace_item(gallery_data, card_idx, {
+                    "path": "static/images/content_filtered.svg",
+                    "prompt_content_filtered": True,
+                    "prompt_content_filtered_timestamp": datetime.datetime.now().isoformat(),
+                })
                 
                 invalidate_reason = "2D prompt content filtered"
-                print(f"2D prompt content filtered for '{object_name}' - using dummy image")
+                logger.warning("2D prompt content filtered for '%s' - using dummy image", object_name)
                 
             else:
-                updated_data = gallery_data.copy()
-                updated_data[card_idx]["image_generation_failed"] = True
-                updated_data[card_idx]["image_generation_error"] = message
-                invalidate_reason = "image generation failed"
-                print(f"Failed to refresh image: {message}")
+                updated_data = replace_item(gallery_data, card_idx, {"image_generation_failed": True, "image_generation_error": message})
+                logger.warning("Failed to refresh image: %s", message)
             
             # Clear the image_generating flag since the operation is complete
-            if "image_generating" in updated_data[card_idx]:
-                del updated_data[card_idx]["image_generating"]
+            updated_data[card_idx] = without_field(updated_data[card_idx], "image_generating")
             
-            updated_data = invalidate_3d_model(updated_data, card_idx, object_name, invalidate_reason)
-            if "batch_processing" in updated_data[card_idx]:
-                del updated_data[card_idx]["batch_processing"]
+            # The card keeps its old image when generation fails, so its 3D model stays valid
+            if invalidate_reason:
+                updated_data = invalidate_3d_model(updated_data, card_idx, object_name, invalidate_reason)
+            updated_data[card_idx] = without_field(updated_data[card_idx], "batch_processing")
             return updated_data
                 
         except Exception as e:
-            print(f"Error refreshing image: {str(e)}")
+            logger.error("Error refreshing image: %s", e)
             # Ensure we clear the image_generating flag even on exception
-            updated_data = gallery_data.copy()
-            if "image_generating" in updated_data[card_idx]:
-                del updated_data[card_idx]["image_generating"]
+            updated_data = list(gallery_data)
+            updated_data[card_idx] = without_field(updated_data[card_idx], "image_generating")
             return updated_data
     
     return refresh_image 
@@ -307,7 +311,7 @@ def create_3d_generation_handler(model_3d_service):
         """Generate a 3D model for a specific card."""
         try:
             if card_idx >= len(gallery_data):
-                print(f"Card index {card_idx} out of range")
+                logger.warning("Card index %s out of range", card_idx)
                 return gallery_data
             
             # Get the current object data
@@ -317,19 +321,19 @@ def create_3d_generation_handler(model_3d_service):
             
             # Validate that we have the required data
             if not object_name or not image_path:
-                print(f"Missing required data for card {card_idx}: title='{object_name}', path='{image_path}'")
+                logger.warning("Missing required data for card %s: title='%s', path='%s'", card_idx, object_name, image_path)
                 return gallery_data
             
             # Check if 3D model already exists
             if obj.get("glb_path"):
-                print(f"3D model already exists for '{object_name}': {obj['glb_path']}")
+                logger.debug("3D model already exists for '%s': %s", object_name, obj['glb_path'])
                 return gallery_data
             
             # Check if generation is already in progress (should be true from immediate update)
             if obj.get("3d_generating"):
-                print(f"3D generation in progress for '{object_name}' - continuing...")
+                logger.debug("3D generation in progress for '%s' - continuing...", object_name)
             else:
-                print(f"3D generation not marked as in progress, but continuing...")
+                logger.debug("3D generation not marked as in progress, but continuing...")
             
             # Set output directory for generated 3D models
             output_dir = config.MODELS_DIR
@@ -340,35 +344,36 @@ def create_3d_generation_handler(model_3d_service):
                 output_dir=output_dir
             )
             
-            # Update the gallery data with the result
-            updated_data = gallery_data.copy()
-            
+            # Update the gallery data with the result, copying only the affected card
             if success and glb_path:
                 # Update the gallery data with the 3D model path
-                updated_data[card_idx]["glb_path"] = glb_path
-                updated_data[card_idx]["3d_generated"] = True
-                updated_data[card_idx]["3d_timestamp"] = datetime.datetime.now().isoformat()
-                updated_data[card_idx]["3d_generating"] = False  # Mark as complete                
-                print(f"Successfully generated 3D model: {glb_path}")
+                updated_data = replace_item(gallery_data, card_idx, {
+                    "glb_path": glb_path,
+                    "glb_exists": True,  # Written by the service; lets the UI skip stat() calls
+                    "3d_generated": True,
+                    "3d_timestamp": datetime.datetime.now().isoformat(),
+                    "3d_generating": False,  # Mark as complete
+                })
+                logger.info("Successfully generated 3D model: %s", glb_path)
                 return updated_data
             elif message == "CONTENT_FILTERED":
                 # Handle 3D content filtered case (from model_3d_service)
-                updated_data[card_idx]["3d_generating"] = False
-                updated_data[card_idx]["content_filtered"] = True
-                updated_data[card_idx]["content_filtered_timestamp"] = datetime.datetime.now().isoformat()
-                print(f"3D content filtered for '{object_name}' - inappropriate content detected")
+                updated_data = replace_item(gallery_data, card_idx, {
+                    "3d_generating": False,
+                    "content_filtered": True,
+                    "content_filtered_timestamp": datetime.datetime.now().isoformat(),
+                })
+                logger.warning("3D content filtered for '%s' - inappropriate content detected", object_name)
                 return updated_data
             else:
                 # Mark generation as failed
-                updated_data[card_idx]["3d_generating"] = False
-                print(f"Failed to generate 3D model: {message}")
+                updated_data = replace_item(gallery_data, card_idx, {"3d_generating": False})
+                logger.warning("Failed to generate 3D model: %s", message)
                 return updated_data
                 
         except Exception as e:
-            print(f"Error generating 3D model: {str(e)}")
+            logger.error("Error generating 3D model: %s", e)
             # Mark generation as failed
-            updated_data = gallery_data.copy()
-            updated_data[card_idx]["3d_generating"] = False
-            return updated_data
+            return replace_item(gallery_data, card_idx, {"3d_generating": False})
     
     return generate_3d_model 
\ No newline at end of file
@@ -19,12 +19,22 @@
 """Image gallery component for displaying generated objects."""
 
 import gradio as gr
+import logging
 from components.image_card import create_image_card
 import config
 
+logger = logging.getLogger(__name__)
+
 MAX_CARDS = config.MAX_CARDS
 CARDS_PER_ROW = config.CARDS_PER_ROW
 
+# Gallery-wide state bits used to decide the "Convert all to 3D" button state
+_HAS_UNCONVERTED = 1
+_BATCH_PROCESSING = 2
+_IMAGE_GENERATING = 4
+_THREE_D_GENERATING = 8
+_BUSY = _BATCH_PROCESSING | _IMAGE_GENERATING | _THREE_D_GENERATING
+
 def create_image_gallery():
     """Create the object gallery interface."""
     
@@ -83,20 +93,22 @@ def create_image_gallery():
                 interactive=False  # Initially disabled, will be enabled when there are unconverted items
             )
         
-        # Utility: get all card outputs
+        # Utility: get all card outputs (the component set is fixed, so the list is built once)
+        all_card_outputs = []
+        for card in card_components:
+            all_card_outputs.extend([card["title_component"], card["image_component"], card["refresh_btn"], card["edit_btn"], card["delete_btn"], card["to_3d_btn"]])
+        all_card_outputs.extend(card_containers)
+        all_card_outputs.append(placeholder_container)  # Add placeholder to outputs
+        all_card_outputs.append(convert_all_btn)  # Add convert all button to outputs
+        
         def get_all_card_outputs():
-            outputs = []
-            for card in card_components:
-                outputs.extend([card["title_component"], card["image_component"], card["refresh_btn"], card["edit_btn"], card["delete_btn"], card["to_3d_btn"]])
-            outputs.extend(card_containers)
-            outputs.append(placeholder_container)  # Add placeholder to outputs
-            outputs.append(convert_all_btn)  # Add convert all button to outputs
-            return outputs
+            return list(all_card_outputs)
         
         # Logic functions
         def delete_card_by_index(index, gallery_data):
-            print(f"Deleting card at index: {index} title: {gallery_data[index]['title']}")
-            updated = [item for i, item in enumerate(gallery_data) if i != index]
+            logger.debug("Deleting card at index: %s title: %s", index, gallery_data[index]['title'])
+            updated = list(gallery_data)
+            del updated[index]
             return updated
 
         def create_delete_function(card_idx):
@@ -106,12 +118,12 @@ def create_image_gallery():
 
         def shift_card_ui(gallery_data):
             """Update the UI to reflect the current gallery data state."""
-            print(f"Updating gallery UI with {len(gallery_data)} objects")
+            logger.debug("Updating gallery UI with %s objects", len(gallery_data))
             updates = []
             for idx in range(MAX_CARDS):
                 if idx < len(gallery_data):
                     obj = gallery_data[idx]
-                    print(f"  Card {idx}: {obj['title']} -> {obj['path']}")
+                    logger.debug("Card %s: %s -> %s", idx, obj['title'], obj['path'])
                     
                     updates.append(gr.update(value=f"### {obj['title']}"))
                     
@@ -163,7 +175,7 @@ def create_image_gallery():
                         button_interactive = False
                         button_classes = ["action-btn", "content-filtered"]
                     elif obj.get("image_generation_failed", False) or obj.get("prompt_content_filtered", False):
-                        print(f"-> 3D button disabled for {obj['title']} due to image generation failed or prompt content filtered")
+                        logger.debug("-> 3D button disabled for %s due to image generation failed or prompt content filtered", obj['title'])
                         button_text = "→ 3D"
                         button_interactive = False
                         button_classes = ["action-btn", "disabled-btn"]
@@ -207,36 +219,22 @@ def create_image_gallery():
             # Show/enable convert all button based on items, unconverted, and processing states
             has_items = len(gallery_data) > 0
             
-            has_unconverted_items = any(
-                idx < len(gallery_data) and 
-                not gallery_data[idx].get("glb_path") and 
-                not gallery_data[idx].get("3d_generating", False) and
-                not gallery_data[idx].get("content_filtered", False) and
-                not gallery_data[idx].get("image_generation_failed", False) and
-                not gallery_data[idx].get("prompt_content_filtered", False)
-                for idx in range(len(gallery_data))
-            )
+            # Collect the gallery-wide states in a single pass as bit flags
+            gallery_state = 0
+            for obj in gallery_data:
+                if obj.get("batch_processing", False):
+                    gallery_state |= _BATCH_PROCESSING
+                if obj.get("image_generating", False):
+                    gallery_state |= _IMAGE_GENERATING
+                if obj.get("3d_generating", False):
+                    gallery_state |= _THREE_D_GENERATING
+                elif not (obj.get("glb_path") or obj.get("content_filtered", False) or obj.get("image_generation_failed", False) or obj.get("prompt_content_filtered", False)):
+                    gallery_state |= _HAS_UNCONVERTED
             
-            is_batch_processing = any(
-                idx < len(gallery_data) and 
-                gallery_data[idx].get("batch_processing", False)
-                for idx in range(len(gallery_data))
-            )
-
-            any_image_generating = any(
-                idx < len(gallery_data) and 
-                gallery_data[idx].get("image_generating", False)
-                for idx in range(len(gallery_data))
-            )
-
-            any_3d_generating = any(
-                idx < len(gallery_data) and 
-                gallery_data[idx].get("3d_generating", False)
-                for idx in range(len(gallery_data))
-            )
+            is_batch_processing = bool(gallery_state & _BATCH_PROCESSING)
             
             show_convert_all = has_items
-            enable_convert_all = has_unconverted_items and not is_batch_processing and not any_image_generating and not any_3d_generating
+            enable_convert_all = bool(gallery_state & _HAS_UNCONVERTED) and not gallery_state & _BUSY
             
             # Set button text based on processing state
             if is_batch_processing:
@@ -246,7 +244,7 @@ def create_image_gallery():
             
             updates.append(gr.update(visible=show_convert_all, interactive=enable_convert_all, value=convert_all_text))
             
-            print(f"Gallery UI updated with {len(gallery_data)} visible cards")
+            logger.debug("Gallery UI updated with %s visible cards", len(gallery_data))
             return updates
         
         # Note: Delete button events are handled in the main app to enable export section updates
@@ -16,7 +16,6 @@
 #
 
 import gradio as gr
-import os
 
 def open_image_settings(image_path, title, gallery_data=None, card_idx=None):
     """Open settings modal for the clicked image."""
@@ -26,7 +25,7 @@ def open_image_settings(image_path, title, gallery_data=None, card_idx=None):
     glb_path = None
     if gallery_data and card_idx is not None and card_idx < len(gallery_data):
         obj = gallery_data[card_idx]
-        if "glb_path" in obj and obj["glb_path"] and os.path.exists(obj["glb_path"]):
+        if obj.get("glb_exists"):
             glb_path = obj["glb_path"]
     
     return f"### {title}", image_path, True, overlay_html, glb_path
@@ -36,6 +35,17 @@ def close_modal():
     overlay_html = "<div id='modal-overlay' style='display:none; position:fixed; top:0; left:0; width:100vw; height:100vh; background:rgba(0,0,0,0.4); z-index:999;'></div>"
     return None, None, False, overlay_html, None
 
+def update_modal_3d_components(gallery_data, card_idx):
+    """Update modal 3D components based on 3D model availability."""
+    if card_idx < len(gallery_data):
+        obj = gallery_data[card_idx]
+        if obj.get("glb_exists"):
+            return gr.update(value=obj["glb_path"], visible=True), gr.update(visible=False)
+        else:
+            return gr.update(value=None, visible=False), gr.update(visible=True)
+    else:
+        return gr.update(value=None, visible=False), gr.update(visible=True)
+
 def save_settings(image_path, title):
     """Save the image settings."""
     return f"Settings saved for {title}", False
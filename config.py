@@ -33,11 +33,14 @@ TRELLIS_DIR = HOME_DIR / ".trellis"  # Hidden directory
 ASSETS_DIR = TRELLIS_DIR / "assets"
 PROMPTS_DIR = TRELLIS_DIR / "prompts"
 SCENE_DIR = TRELLIS_DIR / "scene"
+CACHE_DIR = TRELLIS_DIR / "cache"  # Derived data (encoded static assets, etc.)
+SCENE_PLAN_CACHE_DIR = CACHE_DIR / "scene_plans"
 
 # Create directories
 ASSETS_DIR.mkdir(parents=True, exist_ok=True)
 PROMPTS_DIR.mkdir(parents=True, exist_ok=True)
 SCENE_DIR.mkdir(parents=True, exist_ok=True)
+CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 # Define file paths
 OUTPUT_DIR = ASSETS_DIR
@@ -101,10 +104,24 @@ AGENT_MODEL = "meta/llama-3.1-8b-instruct"
 AGENT_BASE_URL ="http://localhost:19002/v1"
 TRELLIS_BASE_URL = "http://localhost:8000/v1"
 TWO_D_PROMPT_LENGTH = 30
+PROMPT_CHECK_WORKERS = 1  # Threads screening 2D prompts ahead of SANA generation (the guardrail classifier runs one prompt at a time)
+
+# Health polling settings (seconds); the interval doubles between polls up to the cap
+HEALTH_POLL_MIN_INTERVAL = 1  # First poll after startup or a service state change
+HEALTH_POLL_LOADING_MAX_INTERVAL = 5  # Cap while LLM/Trellis are still loading
+HEALTH_POLL_READY_MAX_INTERVAL = 30  # Cap once both services are ready
+
+# Minimum seconds between streamed gallery re-renders during long batch operations
+UI_PROGRESS_THROTTLE_INTERVAL = 0.1
 
 # LLM randomization settings
 LLM_TEMPERATURE = 0.4  # Controls randomness in LLM responses (0.0 = deterministic, 1.0 = very random)
 LLM_RANDOM_SEED_ENABLED = True  # Enable random seed for object generation
+# Opt-in: reuse the scene plan for a repeated description, in memory and on disk under
+# SCENE_PLAN_CACHE_DIR. A cached plan repeats the same scene, so it only takes effect
+# when LLM_RANDOM_SEED_ENABLED is False. Input classifications are always cached.
+SCENE_PLAN_CACHE_ENABLED = False
+LLM_CACHE_SIZE = 256  # Scene classifications/plans kept in memory
 
 # Simple helper functions
 def get_static_paths():
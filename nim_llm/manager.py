@@ -19,11 +19,21 @@
 import subprocess
 import sys
 import os
-import time
 from pathlib import Path
 
 from .constants import CONTAINER_NAME
 
+# Seconds podman is given to report the container as stopped before it is force-removed
+STOP_TIMEOUT = 5
+
+
+def _podman_command(script):
+    """Return the command that runs a podman shell script, inside WSL on Windows."""
+    # Prefer running inside WSL if available, mirroring run_llama.py behavior
+    if os.name == "nt":
+        return ["wsl", "-d", "NVIDIA-Workbench", "/bin/bash", "-lc", script]
+    return ["bash", "-lc", script]
+
 
 def is_container_running() -> bool:
     """Check if the container is currently running.
@@ -31,14 +41,7 @@ def is_container_running() -> bool:
     Returns True if the container exists and is running, False otherwise.
     """
     try:
-        # Prefer running inside WSL if available
-        if os.name == "nt":
-            cmd = [
-                "wsl", "-d", "NVIDIA-Workbench", "/bin/bash", "-lc",
-                f"podman ps -a --format '{{{{.Names}}}} {{{{.Status}}}}' | grep '^{CONTAINER_NAME}' || true"
-            ]
-        else:
-            cmd = ["bash", "-lc", f"podman ps -a --format '{{{{.Names}}}} {{{{.Status}}}}' | grep '^{CONTAINER_NAME}' || true"]
+        cmd = _podman_command(f"podman ps -a --format '{{{{.Names}}}} {{{{.Status}}}}' | grep '^{CONTAINER_NAME}' || true")
 
         result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, timeout=10)
         
@@ -70,64 +73,41 @@ def stop_container() -> bool:
         
         print(f"Stopping container {CONTAINER_NAME}...")
         
-        # Prefer running inside WSL if available, mirroring run_llama.py behavior
-        if os.name == "nt":
-            # Use WSL to call podman
-            cmd = [
-                "wsl", "-d", "NVIDIA-Workbench", "/bin/bash", "-lc",
-                f"podman kill {CONTAINER_NAME} || true"
-            ]
-        else:
-            cmd = ["bash", "-lc", f"podman stop {CONTAINER_NAME} || true"]
-
-        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, timeout=30)
+        # Stop the container and let podman wait for it to exit in the same shell,
+        # rather than polling 'podman ps' from here (each call is a WSL round trip)
+        stop = "kill" if os.name == "nt" else "stop"
+        result = subprocess.run(
+            _podman_command(
+                f"podman {stop} {CONTAINER_NAME} || true; "
+                f"timeout {STOP_TIMEOUT} podman wait --condition=stopped --condition=exited {CONTAINER_NAME} >/dev/null 2>&1 || true"
+            ),
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, timeout=30 + STOP_TIMEOUT
+        )
         print(result.stdout.strip())
         
         if result.returncode != 0:
             print(f"Warning: podman stop command failed with return code {result.returncode}")
         
-        # Wait for container to actually stop
-        print("Waiting for container to stop...")
-        start_time = time.time()
-        timeout = 5  # 5 seconds timeout
-        
-        while time.time() - start_time < timeout:
-            if not is_container_running():
-                print(f"✅ Container {CONTAINER_NAME} stopped successfully")
-                return True
-            print("Container still stopping, waiting...")
-            time.sleep(1)
-        
-        # If container didn't stop gracefully, try force removal
-        print(f"Container {CONTAINER_NAME} did not stop within {timeout} seconds, attempting force removal...")
+        if not is_container_running():
+            print(f"✅ Container {CONTAINER_NAME} stopped successfully")
+            return True
         
-        if os.name == "nt":
-            force_cmd = [
-                "wsl", "-d", "NVIDIA-Workbench", "/bin/bash", "-lc",
-                f"podman rm -f {CONTAINER_NAME} || true"
-            ]
-        else:
-            force_cmd = ["bash", "-lc", f"podman rm -f {CONTAINER_NAME} || true"]
+        # If container didn't stop gracefully, try force removal ('rm -f' returns once it is gone)
+        print(f"Container {CONTAINER_NAME} did not stop within {STOP_TIMEOUT} seconds, attempting force removal...")
         
-        force_result = subprocess.run(force_cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, timeout=30)
+        force_result = subprocess.run(_podman_command(f"podman rm -f {CONTAINER_NAME} || true"), stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, timeout=30)
         print(force_result.stdout.strip())
         
         if force_result.returncode != 0:
             print(f"Warning: podman rm -f command failed with return code {force_result.returncode}")
         
-        # Wait for container to be removed
-        print("Waiting for container to be removed...")
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if not is_container_running():
-                print(f"✅ Container {CONTAINER_NAME} force-removed successfully")
-                return True
-            print("Container still being removed, waiting...")
-            time.sleep(1)
+        if not is_container_running():
+            print(f"✅ Container {CONTAINER_NAME} force-removed successfully")
+            return True
         
-        print(f"❌ Timeout: Container {CONTAINER_NAME} could not be stopped or removed within {timeout} seconds")
+        print(f"❌ Container {CONTAINER_NAME} could not be stopped or removed")
         return False
         
     except Exception as e:
         print(f"Failed to stop container {CONTAINER_NAME}: {e}")
-        return False 
\ No newline at end of file
+        return False 
@@ -21,6 +21,9 @@ import logging
 import requests
 import json
 import random
+import re
+import hashlib
+from collections import OrderedDict
 from datetime import datetime
 from enum import Enum
 from griptape.structures import Agent
@@ -28,6 +31,7 @@ from griptape.drivers.prompt.openai import OpenAiChatPromptDriver
 from griptape.memory.structure import ConversationMemory
 from griptape.rules import Rule
 import config
+from utils import save_json, load_json, ensure_dir
 
 # Set up logging
 logging.basicConfig(level="INFO", format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -37,6 +41,31 @@ logger = logging.getLogger(__name__)
 AGENT_MODEL = config.AGENT_MODEL
 AGENT_BASE_URL = config.AGENT_BASE_URL
 
+# Inputs that can be classified without asking the LLM
+_WORD_RE = re.compile(r"\w+")
+_TRIVIAL_INPUTS = {
+    "hi": "GREETING",
+    "hello": "GREETING",
+    "hey": "GREETING",
+    "good morning": "GREETING",
+    "good evening": "GREETING",
+    "thanks": "GENERAL_CHAT",
+    "thank you": "GENERAL_CHAT",
+    "ok": "GENERAL_CHAT",
+    "okay": "GENERAL_CHAT",
+    "test": "GENERAL_CHAT",
+    "help": "QUESTION",
+}
+
+
+def _classify_trivial_input(user_input):
+    """Return a classification for obviously non-scene input, or None if the LLM is needed."""
+    words = _WORD_RE.findall(user_input.lower())
+    if not words:
+        # Punctuation or symbols only, e.g. "?" or "..."
+        return "QUESTION" if "?" in user_input else "GENERAL_CHAT"
+    return _TRIVIAL_INPUTS.get(" ".join(words))
+
 
 class RuleType(Enum):
     """Enum for different rule types."""
@@ -174,6 +203,8 @@ class AgentService:
     def __init__(self):
         """Initialize the agent service."""
         self.agent = None
+        self._classification_cache = OrderedDict()
+        self._scene_plan_cache = OrderedDict()
         self._initialize_agent()
     
     def _initialize_agent(self):
@@ -197,15 +228,41 @@ class AgentService:
         except Exception as e:
             return f"Error communicating with agent: {str(e)}"
     
+    @staticmethod
+    def _normalize_prompt(text):
+        """Canonical form of user input used as a cache key."""
+        return " ".join(text.lower().split())
+    
+    @staticmethod
+    def _remember(cache, key, value):
+        """Store a value in a bounded LRU cache."""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > config.LLM_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    def _scene_plan_cache_file(self, key):
+        """Path of the on-disk scene plan for a normalized description."""
+        # Model and prompt settings are part of the key so stale plans are not reused
+        cache_key = f"{AGENT_MODEL}|{config.NUM_OF_OBJECTS}|{config.TWO_D_PROMPT_LENGTH}|{key}"
+        return config.SCENE_PLAN_CACHE_DIR / f"{hashlib.md5(cache_key.encode('utf-8')).hexdigest()}.json"
+    
     def classify_input(self, user_input):
         """Classify if user input is a scene description or something else."""
         try:
             if not user_input.strip():
                 return "EMPTY", "Please enter a scene description."
             
-            # Use the LLM to classify the input
-            response = self.agent.run(user_input, RuleType.INPUT_CLASSIFICATION)
-            classification = response.output.value.strip().upper()
+            # Skip the LLM round trip for greetings, thanks and other trivial input
+            key = self._normalize_prompt(user_input)
+            classification = _classify_trivial_input(user_input) or self._classification_cache.get(key)
+            if classification:
+                logger.info(f"Classified input without LLM: {classification}")
+            else:
+                # Use the LLM to classify the input
+                response = self.agent.run(user_input, RuleType.INPUT_CLASSIFICATION)
+                classification = response.output.value.strip().upper()
+                self._remember(self._classification_cache, key, classification)
             
             # Validate the classification
             valid_classifications = ["SCENE", "GREETING", "QUESTION", "GENERAL_CHAT"]
@@ -286,7 +343,35 @@ Scene arrangement: [Brief description of how these objects could be arranged tog
     
     
     def generate_objects_and_prompts(self, description):
-        """Generate objects and 2D prompts for the scene objects."""
+        """Generate objects and 2D prompts for the scene objects.
+        
+        Plans are reused for repeated descriptions only when SCENE_PLAN_CACHE_ENABLED
+        is set and random seeding is disabled; with seeding enabled every request is
+        meant to produce a fresh scene.
+        """
+        if not config.SCENE_PLAN_CACHE_ENABLED or config.LLM_RANDOM_SEED_ENABLED:
+            return self._generate_objects_and_prompts(description)
+        
+        key = self._normalize_prompt(description)
+        prompts = self._scene_plan_cache.get(key)
+        if prompts is None:
+            cache_file = self._scene_plan_cache_file(key)
+            if cache_file.exists():
+                prompts = load_json(cache_file)
+        if prompts:
+            logger.info(f"Reusing cached scene plan for: {key}")
+            self._remember(self._scene_plan_cache, key, prompts)
+            return True, dict(prompts), "2D prompts generated successfully"
+        
+        success, prompts, message = self._generate_objects_and_prompts(description)
+        if success and prompts:
+            self._remember(self._scene_plan_cache, key, dict(prompts))
+            ensure_dir(config.SCENE_PLAN_CACHE_DIR)
+            save_json(prompts, self._scene_plan_cache_file(key))
+        return success, prompts, message
+    
+    def _generate_objects_and_prompts(self, description):
+        """Ask the LLM for scene objects and their 2D prompts."""
         try:
             # Get objects for the scene
             objects = self.generate_objects_for_scene(description)
@@ -16,6 +16,7 @@
 #
 
 import logging
+import threading
 from transformers import pipeline
 import config
 
@@ -29,13 +30,25 @@ class GuardrailService:
         self.model_name = model_name
         self.pipe = None
         self.is_loaded = False
+        self._load_lock = threading.Lock()
+        # The transformers pipeline (and its fast tokenizer) is not safe to call from
+        # several threads at once, so classifications run one at a time
+        self._infer_lock = threading.Lock()
         
     def load_model(self):
         """Load the NSFW Prompt Detector model for content filtering."""
-        try:
+        if self.is_loaded:
+            return True
+        
+        with self._load_lock:
+            # Another thread may have finished loading while we waited
             if self.is_loaded:
                 return True
-                
+            return self._load_pipeline()
+    
+    def _load_pipeline(self):
+        """Load the pipeline; callers must hold the load lock."""
+        try:
             logger.info(f"Loading NSFW Prompt Detector model: {self.model_name}")
             
             # Load the pipeline
@@ -58,7 +71,8 @@ class GuardrailService:
                 return False
             
             # Use the pipeline to classify the prompt
-            result = self.pipe(prompt)
+            with self._infer_lock:
+                result = self.pipe(prompt)
             
             # The model returns a score indicating NSFW content
             score = result[0]["score"]
@@ -20,13 +20,15 @@
 import os
 import logging
 import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import torch
 import gc
 from diffusers import SanaSprintPipeline
 import time
 import config
 from services.guardrail_service import GuardrailService
-from utils import clear_image_generation_failure_flags, check_gpu_vram_capacity
+from utils import clear_image_generation_failure_flags, check_gpu_vram_capacity, with_overrides
 
 # Set environment variables for better memory management
 os.environ["PYTORCH_CUDA_ALLOC_CONF"] = "max_split_size_mb:128"
@@ -34,6 +36,10 @@ os.environ["CUDA_LAUNCH_BLOCKING"] = "0"
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for prompt safety checks. SANA runs one image at a time on the GPU, so
+# the checks for later objects run here while earlier images are being generated.
+_PROMPT_CHECK_EXECUTOR = ThreadPoolExecutor(max_workers=config.PROMPT_CHECK_WORKERS, thread_name_prefix="promptcheck")
+
 class ImageGenerationService:
     def __init__(self):
         self.sana_pipeline = None
@@ -41,6 +47,7 @@ class ImageGenerationService:
         self.model_path = "Efficient-Large-Model/Sana_Sprint_0.6B_1024px_diffusers"
         self.device = None
         self.guardrail_service = GuardrailService()
+        self._load_lock = threading.Lock()
         
     def _clear_gpu_memory(self):
         """Clear GPU memory to prevent fragmentation."""
@@ -92,6 +99,12 @@ class ImageGenerationService:
     
     def load_sana_model(self, device="cuda:0", force_reload=False):
         """Load the SANA model for image generation with optimizations."""
+        # A background prewarm and a request may both get here; only one loads the weights
+        with self._load_lock:
+            return self._load_sana_model(device, force_reload)
+    
+    def _load_sana_model(self, device, force_reload):
+        """Load the SANA model; callers must hold the load lock."""
         try:
             print(f"Timestamp before load_sana_model: {time.time()}")
             if self.is_loaded and self.sana_pipeline is not None and not force_reload:
@@ -116,11 +129,11 @@ class ImageGenerationService:
             print(f"Time taken to load SANA model: {time.time() - initial_time} seconds")
             
             initial_time = time.time()
-            # Move to GPU with memory optimization
-            self.move_sana_pipeline_to_device("cuda:0")
+            # Move to the requested device with memory optimization
+            self.move_sana_pipeline_to_device(device)
             
-            print(f"Time taken to move SANA model to GPU: {time.time() - initial_time} seconds")
-            print(f"Timestamp after move_sana_model_to_gpu: {time.time()}")
+            print(f"Time taken to move SANA model to {device}: {time.time() - initial_time} seconds")
+            print(f"Timestamp after move_sana_model_to_device: {time.time()}")
         
             self.is_loaded = True
             logger.info("Successfully loaded SANA model")   
@@ -133,6 +146,17 @@ class ImageGenerationService:
             self.sana_pipeline = None
             return False
         
+    def prewarm(self):
+        """Load the guardrail and SANA weights ahead of the first request.
+        
+        SANA is loaded to the CPU since the LLM may still hold the GPU; a pipeline
+        that is already loaded is left on its current device.
+        """
+        self.guardrail_service.load_model()
+        with self._load_lock:
+            if not self.is_loaded:
+                self._load_sana_model("cpu", force_reload=False)
+        
     def cleanup_sana_pipeline(self):
         """Clean up the current model"""
         if self.sana_pipeline is not None:
@@ -166,12 +190,18 @@ class ImageGenerationService:
         return check_gpu_vram_capacity(vram_threshold)
         
     
-    def generate_image_from_prompt(self, object_name, prompt, output_dir, seed=42):
-        """Generate a single image from a prompt using SANA model."""
+    def generate_image_from_prompt(self, object_name, prompt, output_dir, seed=42, safety_result=None):
+        """Generate a single image from a prompt using SANA model.
+        
+        safety_result may carry an (is_safe, message) tuple from a check already run
+        for this prompt; otherwise the guardrail is consulted here.
+        """
         try:
             # First, check content safety using guardrail
-            logger.info(f"Checking content safety for prompt: {prompt[:100]}...")
-            is_safe, safety_message = self.guardrail_service.check_prompt_safety(prompt)
+            if safety_result is None:
+                logger.info(f"Checking content safety for prompt: {prompt[:100]}...")
+                safety_result = self.guardrail_service.check_prompt_safety(prompt)
+            is_safe, safety_message = safety_result
             
             if not is_safe:
                 logger.warning(f"2D prompt flagged as inappropriate for {object_name}: {safety_message}")
@@ -212,44 +242,70 @@ class ImageGenerationService:
             logger.error(f"Error generating image: {e}")
             return False, f"Error generating image: {str(e)}", None
     
-    def generate_images_for_objects(self, objects_data, output_dir="static/images/generated"):
-        """Generate images for all objects in the gallery data."""
-        try:
-            if not self.load_sana_model():
-                return False, "Failed to load SANA model", {}
+    def iter_images_for_objects(self, objects_data, output_dir="static/images/generated"):
+        """Generate images one object at a time, yielding (obj, image_path) as each finishes.
+        
+        image_path is None when generation failed or the prompt was content filtered;
+        the object carries the corresponding flags in that case. The yielded object is
+        a copy whenever a flag changes; the items in objects_data are never modified.
+        """
+        # Screen every prompt up front; the checks overlap with model loading and generation
+        safety_checks = [
+            _PROMPT_CHECK_EXECUTOR.submit(self.guardrail_service.check_prompt_safety, obj["description"])
+            for obj in objects_data
+        ]
+        
+        if not self.load_sana_model():
+            raise RuntimeError("Failed to load SANA model")
+        
+        # Create output directory
+        os.makedirs(output_dir, exist_ok=True)
+        
+        for obj, safety_check in zip(objects_data, safety_checks):
+            object_name = obj["title"]
+            prompt = obj["description"]
             
-            # Create output directory
-            os.makedirs(output_dir, exist_ok=True)
+            logger.info(f"Generating image for: {object_name}")
+            success, message, image_path = self.generate_image_from_prompt(
+                object_name, prompt, output_dir, safety_result=safety_check.result()
+            )
             
+            if success and image_path:
+                # Clear any previous failure flags since image generation succeeded
+                obj = clear_image_generation_failure_flags(obj)
+                logger.info(f"Generated image for {object_name}: {image_path}")
+            elif message == "PROMPT_CONTENT_FILTERED":
+                # Mark object as 2D prompt content filtered
+                obj = with_overrides(obj, {
+                    "path": "static/images/content_filtered.svg",
+                    "prompt_content_filtered": True,
+                    "prompt_content_filtered_timestamp": datetime.datetime.now().isoformat(),
+                })
+                image_path = None
+                logger.warning(f"2D prompt content filtered for {object_name}")
+            else:
+                # Mark object as having failed image generation
+                obj = with_overrides(obj, {"image_generation_failed": True, "image_generation_error": message})
+                image_path = None
+                logger.error(f"Failed to generate image for {object_name}: {message}")
+            
+            yield obj, image_path
+    
+    def generate_images_for_objects(self, objects_data, output_dir="static/images/generated"):
+        """Generate images for all objects in the gallery data.
+        
+        Each entry of objects_data is replaced with its flagged copy as it finishes.
+        """
+        try:
             generated_images = {}
             content_filtered_objects = []
             
-            for obj in objects_data:
-                object_name = obj["title"]
-                prompt = obj["description"]
-                
-                logger.info(f"Generating image for: {object_name}")
-                success, message, image_path = self.generate_image_from_prompt(
-                    object_name, prompt, output_dir
-                )
-                
-                if success and image_path:
-                    generated_images[object_name] = image_path
-                    # Clear any previous failure flags since image generation succeeded
-                    obj = clear_image_generation_failure_flags(obj)
-                    logger.info(f"Generated image for {object_name}: {image_path}")
-                elif message == "PROMPT_CONTENT_FILTERED":
-                    # Mark object as 2D prompt content filtered
-                    obj["path"] = "static/images/content_filtered.svg"
-                    obj["prompt_content_filtered"] = True
-                    obj["prompt_content_filtered_timestamp"] = datetime.datetime.now().isoformat()
-                    content_filtered_objects.append(object_name)
-                    logger.warning(f"2D prompt content filtered for {object_name}")
-                else:
-                    # Mark object as having failed image generation
-                    obj["image_generation_failed"] = True
-                    obj["image_generation_error"] = message
-                    logger.error(f"Failed to generate image for {object_name}: {message}")
+            for idx, (obj, image_path) in enumerate(self.iter_images_for_objects(objects_data, output_dir)):
+                objects_data[idx] = obj
+                if image_path:
+                    generated_images[obj["title"]] = image_path
+                elif obj.get("prompt_content_filtered"):
+                    content_filtered_objects.append(obj["title"])
             
             # Log summary
             if content_filtered_objects:
@@ -259,4 +315,4 @@ class ImageGenerationService:
             
         except Exception as e:
             logger.error(f"Error generating images for objects: {e}")
-            return False, f"Error generating images: {str(e)}", {} 
\ No newline at end of file
+            return False, f"Error generating images: {str(e)}", {}
@@ -34,13 +34,12 @@ if errorlevel 1 (
     echo [WARNING] Failed to stop Trellis container gracefully
 )
 
-:: Kill any remaining Python processes that might be running the services
-echo Stopping Python processes...
-taskkill /f /im python.exe 2>nul
+:: Stop app.py through its termination server, which reports the PID of that one process.
+:: The run_llama.py / run_trellis.py runners exit on their own once their containers stop.
+echo Stopping app.py...
+call conda run -n trellis --no-capture-output python -c "import sys; from terminator import TrellisTerminator; sys.exit(0 if TrellisTerminator().terminate_server() else 1)"
 if errorlevel 1 (
-    echo No Python processes found to stop
-) else (
-    echo Python processes stopped
+    echo [WARNING] Failed to stop app.py gracefully
 )
 
 echo.
@@ -17,7 +17,6 @@
 
 
 import socket
-import time
 import logging
 import os
 import signal
@@ -32,6 +31,20 @@ logger = logging.getLogger(__name__)
 LLM_CONTAINER_NAME = "CHAT_TO_3D"
 TRELLIS_CONTAINER_NAME = "TRELLIS_NIM"
 
+# Seconds podman is given to report a container as stopped before it is force-removed
+CONTAINER_STOP_TIMEOUT = 15
+
+def _podman_command(script):
+    """Return the command that runs a podman shell script, inside WSL on Windows."""
+    # Prefer running inside WSL if available
+    if os.name == "nt":
+        return ["wsl", "-d", "NVIDIA-Workbench", "/bin/bash", "-lc", script]
+    return ["bash", "-lc", script]
+
+# Seconds to wait for the termination server to accept a connection; it runs on
+# this machine, so an open port answers well within this
+PROBE_TIMEOUT = 0.05
+
 class TrellisTerminator:
     def __init__(self, host='localhost', port=12345):
         self.host = host
@@ -41,10 +54,10 @@ class TrellisTerminator:
         """Check if the server is running by attempting to connect."""
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as client:
-                client.settimeout(0.5)
+                client.settimeout(PROBE_TIMEOUT)
                 client.connect((self.host, self.port))
             return True
-        except (ConnectionRefusedError, socket.timeout):
+        except OSError:
             return False
 
     def is_container_running(self, container_name):
@@ -53,14 +66,7 @@ class TrellisTerminator:
         Returns True if the container exists and is running, False otherwise.
         """
         try:
-            # Prefer running inside WSL if available
-            if os.name == "nt":
-                cmd = [
-                    "wsl", "-d", "NVIDIA-Workbench", "/bin/bash", "-lc",
-                    f"podman ps -a --format '{{{{.Names}}}} {{{{.Status}}}}' | grep '^{container_name}' || true"
-                ]
-            else:
-                cmd = ["bash", "-lc", f"podman ps -a --format '{{{{.Names}}}} {{{{.Status}}}}' | grep '^{container_name}' || true"]
+            cmd = _podman_command(f"podman ps -a --format '{{{{.Names}}}} {{{{.Status}}}}' | grep '^{container_name}' || true")
 
             result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, timeout=10)
             
@@ -91,62 +97,39 @@ class TrellisTerminator:
             
             logger.info(f"Stopping container {container_name}...")
             
-            # Prefer running inside WSL if available
-            if os.name == "nt":
-                # Use WSL to call podman
-                cmd = [
-                    "wsl", "-d", "NVIDIA-Workbench", "/bin/bash", "-lc",
-                    f"podman kill {container_name} || true"
-                ]
-            else:
-                cmd = ["bash", "-lc", f"podman stop {container_name} || true"]
-
-            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, timeout=30)
+            # Stop the container and let podman wait for it to exit in the same shell,
+            # rather than polling 'podman ps' from here (each call is a WSL round trip)
+            stop = "kill" if os.name == "nt" else "stop"
+            result = subprocess.run(
+                _podman_command(
+                    f"podman {stop} {container_name} || true; "
+                    f"timeout {CONTAINER_STOP_TIMEOUT} podman wait --condition=stopped --condition=exited {container_name} >/dev/null 2>&1 || true"
+                ),
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, timeout=30 + CONTAINER_STOP_TIMEOUT
+            )
             logger.info(result.stdout.strip())
             
             if result.returncode != 0:
                 logger.warning(f"Warning: podman stop command failed with return code {result.returncode}")
             
-            # Wait for container to actually stop
-            logger.info("Waiting for container to stop...")
-            start_time = time.time()
-            timeout = 15  # 15 seconds timeout
-            
-            while time.time() - start_time < timeout:
-                if not self.is_container_running(container_name):
-                    logger.info(f"✅ Container {container_name} stopped successfully")
-                    return True
-                logger.info("Container still stopping, waiting...")
-                time.sleep(1)
-            
-            # If container didn't stop gracefully, try force removal
-            logger.warning(f"Container {container_name} did not stop within {timeout} seconds, attempting force removal...")
+            if not self.is_container_running(container_name):
+                logger.info(f"✅ Container {container_name} stopped successfully")
+                return True
             
-            if os.name == "nt":
-                force_cmd = [
-                    "wsl", "-d", "NVIDIA-Workbench", "/bin/bash", "-lc",
-                    f"podman rm -f {container_name} || true"
-                ]
-            else:
-                force_cmd = ["bash", "-lc", f"podman rm -f {container_name} || true"]
+            # If container didn't stop gracefully, try force removal ('rm -f' returns once it is gone)
+            logger.warning(f"Container {container_name} did not stop within {CONTAINER_STOP_TIMEOUT} seconds, attempting force removal...")
             
-            force_result = subprocess.run(force_cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, timeout=30)
+            force_result = subprocess.run(_podman_command(f"podman rm -f {container_name} || true"), stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, timeout=30)
             logger.info(force_result.stdout.strip())
             
             if force_result.returncode != 0:
                 logger.warning(f"Warning: podman rm -f command failed with return code {force_result.returncode}")
             
-            # Wait for container to be removed
-            logger.info("Waiting for container to be removed...")
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                if not self.is_container_running(container_name):
-                    logger.info(f"✅ Container {container_name} force-removed successfully")
-                    return True
-                logger.info("Container still being removed, waiting...")
-                time.sleep(1)
+            if not self.is_container_running(container_name):
+                logger.info(f"✅ Container {container_name} force-removed successfully")
+                return True
             
-            logger.error(f"❌ Timeout: Container {container_name} could not be stopped or removed within {timeout} seconds")
+            logger.error(f"❌ Container {container_name} could not be stopped or removed")
             return False
             
         except Exception as e:
@@ -156,24 +139,30 @@ class TrellisTerminator:
     def terminate_process(self, pid):
         """Terminate process with SIGTERM, fallback to SIGKILL if needed."""
         try:
+            process = psutil.Process(pid)
+            
             # Try graceful termination first
             os.kill(pid, signal.SIGTERM)
             logger.info(f"Sent SIGTERM to process {pid}")
             
-            # Wait for process to terminate
-            for _ in range(5):
-                if not psutil.pid_exists(pid):
-                    logger.info(f"Process {pid} terminated successfully")
-                    return True
-                time.sleep(1)
+            # Wait for process to terminate; returns as soon as it exits
+            try:
+                process.wait(timeout=5)
+                logger.info(f"Process {pid} terminated successfully")
+                return True
+            except psutil.TimeoutExpired:
+                pass
             
             # If still running, force kill
-            if psutil.pid_exists(pid):
-                logger.warning(f"Process {pid} did not terminate gracefully, sending SIGKILL")
-                os.kill(pid, signal.SIGKILL)
-                time.sleep(1)
-                return not psutil.pid_exists(pid)
-            
+            logger.warning(f"Process {pid} did not terminate gracefully, sending SIGKILL")
+            os.kill(pid, signal.SIGKILL)
+            try:
+                process.wait(timeout=1)
+            except psutil.TimeoutExpired:
+                return False
+            return True
+        except psutil.NoSuchProcess:
+            logger.info(f"Process {pid} terminated successfully")
             return True
         except Exception as e:
             logger.error(f"Error terminating process {pid}: {e}")
@@ -214,6 +203,17 @@ class TrellisTerminator:
             logger.warning("Some NIM containers failed to stop")
         
         # Then handle TRELLIS server if running
+        if not self.terminate_server():
+            success = False
+
+        return success
+
+    def terminate_server(self):
+        """Terminate the TRELLIS process through its termination server, if it is running.
+        
+        Returns True if the process was terminated or the server was not running.
+        """
+        success = True
         if not self.is_server_running():
             logger.info("TRELLIS server not running")
         else:
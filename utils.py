@@ -64,6 +64,53 @@ def get_timestamp():
     return datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
+def with_overrides(obj, fields):
+    """
+    Return obj with the given fields set, copying it only if a value actually changes.
+    
+    Args:
+        obj (dict): The gallery item to update
+        fields (dict): Field names and the values they should have
+        
+    Returns:
+        dict: obj itself when every field already matches, otherwise a new dict
+    """
+    if all(key in obj and obj[key] == value for key, value in fields.items()):
+        return obj
+    return {**obj, **fields}
+
+
+def without_field(obj, *fields):
+    """
+    Return obj without the given fields, copying it only if one of them is present.
+    
+    Args:
+        obj (dict): The gallery item to update
+        *fields (str): Field names to drop
+        
+    Returns:
+        dict: obj itself when every field is absent, otherwise a new dict
+    """
+    if not any(field in obj for field in fields):
+        return obj
+    return {key: value for key, value in obj.items() if key not in fields}
+
+
+def replace_item(gallery_data, idx, fields):
+    """
+    Return a new gallery list in which only the item at idx is replaced with an updated copy.
+    
+    Args:
+        gallery_data (list): The current gallery items
+        idx (int): Index of the item to update
+        fields (dict): Field names and the values they should have
+        
+    Returns:
+        list: A new list sharing every other item with gallery_data
+    """
+    return [*gallery_data[:idx], with_overrides(gallery_data[idx], fields), *gallery_data[idx + 1:]]
+
+
 def clear_image_generation_failure_flags(obj):
     """
     Clear image generation failure flags from an object.
@@ -72,19 +119,16 @@ def clear_image_generation_failure_flags(obj):
         obj (dict): The object dictionary containing image generation flags
         
     Returns:
-        dict: The object with failure flags cleared
+        dict: obj itself when no failure flag is set, otherwise a copy without them
     """
     # Clear any previous failure flags since image generation succeeded
-    if "image_generation_failed" in obj:
-        del obj["image_generation_failed"]
-    if "image_generation_error" in obj:
-        del obj["image_generation_error"]
-    if "prompt_content_filtered" in obj:
-        del obj["prompt_content_filtered"]
-    if "prompt_content_filtered_timestamp" in obj:
-        del obj["prompt_content_filtered_timestamp"]
-    
-    return obj 
+    return without_field(
+        obj,
+        "image_generation_failed",
+        "image_generation_error",
+        "prompt_content_filtered",
+        "prompt_content_filtered_timestamp",
+    )
 
 
 def check_gpu_vram_capacity(vram_threshold):
@@ -126,13 +170,10 @@ def disable_all_buttons_for_3d_generation(gallery_data):
     if not should_disable_buttons_during_3d_generation():
         return gallery_data
     
-    updated_data = gallery_data.copy()
-    
     # Mark all items as having 3D generation in progress to disable buttons
-    for idx, obj in enumerate(updated_data):
-        updated_data[idx]["3d_generation_global"] = True
+    updated_data = [with_overrides(obj, {"3d_generation_global": True}) for obj in gallery_data]
     
-    print(f"🔒 Disabled all edit/refresh buttons for {len(gallery_data)} items during 3D generation (VRAM threshold met)")
+    logging.debug("🔒 Disabled all edit/refresh buttons for %s items during 3D generation (VRAM threshold met)", len(gallery_data))
     return updated_data
 
 
@@ -140,43 +181,32 @@ def enable_all_buttons_after_3d_generation(gallery_data):
     """Re-enable all edit and refresh buttons on all cards after 3D generation completes."""
     if not should_disable_buttons_during_3d_generation():
         return gallery_data
-    updated_data = gallery_data.copy()
-
     # if any of the items still has 3d_generating flag, do not re-enable buttons
-    for idx, obj in enumerate(updated_data):
-        if updated_data[idx].get("3d_generating", False):
-            print(f"❌ Do not re-enable buttons because 3d_generating flag is still present for item {idx} title: {updated_data[idx]['title']}")
+    for idx, obj in enumerate(gallery_data):
+        if obj.get("3d_generating", False):
+            logging.warning("❌ Do not re-enable buttons because 3d_generating flag is still present for item %s title: %s", idx, obj['title'])
             return gallery_data
     
-    # Clear the global 3D generation flag for all items
-    for idx, obj in enumerate(updated_data):
-        if "3d_generation_global" in updated_data[idx]:
-            del updated_data[idx]["3d_generation_global"]
+    # Clear the global 3D generation flag for all items (items are shared between snapshots, so never edit them in place)
+    updated_data = [without_field(obj, "3d_generation_global") for obj in gallery_data]
     
-    print(f"🔓 Re-enabled all edit/refresh buttons for {len(gallery_data)} items after 3D generation")
+    logging.debug("🔓 Re-enabled all edit/refresh buttons for %s items after 3D generation", len(gallery_data))
     return updated_data
 
 
 def disable_all_buttons_for_image_operations(gallery_data):
     """Disable all edit and refresh buttons on all cards when image refresh or edit is in progress."""
-    updated_data = gallery_data.copy()
-    
     # Mark all items as having image operations in progress to disable buttons
-    for idx, obj in enumerate(updated_data):
-        updated_data[idx]["image_operations_global"] = True
+    updated_data = [with_overrides(obj, {"image_operations_global": True}) for obj in gallery_data]
     
-    print(f"🔒 Disabled all edit/refresh buttons for {len(gallery_data)} items during image operations")
+    logging.debug("🔒 Disabled all edit/refresh buttons for %s items during image operations", len(gallery_data))
     return updated_data
 
 
 def enable_all_buttons_after_image_operations(gallery_data):
     """Re-enable all edit and refresh buttons on all cards after image operations complete."""
-    updated_data = gallery_data.copy()
-    
-    # Clear the global image operations flag for all items
-    for idx, obj in enumerate(updated_data):
-        if "image_operations_global" in updated_data[idx]:
-            del updated_data[idx]["image_operations_global"]
+    # Clear the global image operations flag for all items (items are shared between snapshots, so never edit them in place)
+    updated_data = [without_field(obj, "image_operations_global") for obj in gallery_data]
     
-    print(f"🔓 Re-enabled all edit/refresh buttons for {len(gallery_data)} items after image operations")
+    logging.debug("🔓 Re-enabled all edit/refresh buttons for %s items after image operations", len(gallery_data))
     return updated_data
\ No newline at end of file